@@ -1,10 +1,12 @@
 """Pretty-print tabular data."""
 
-from collections import namedtuple
-from collections.abc import Iterable, Sized
+from collections import Counter, namedtuple
+from collections.abc import Iterable, Iterator, Sized
 from html import escape as htmlescape
-from itertools import chain, zip_longest as izip_longest
-from functools import reduce, partial
+import concurrent.futures
+from itertools import chain, count, repeat, zip_longest as izip_longest
+from functools import lru_cache, reduce, partial
+from operator import itemgetter
 import io
 import re
 import math
@@ -21,7 +23,14 @@ def _is_file(f):
     return isinstance(f, io.IOBase)
 
 
-__all__ = ["tabulate", "tabulate_formats", "simple_separated_format"]
+__all__ = [
+    "tabulate",
+    "tabulate_iter",
+    "tabulate_formats",
+    "simple_separated_format",
+    "TableLayout",
+    "IncrementalTable",
+]
 try:
     from .version import version as __version__  # noqa: F401
 except ImportError:
@@ -34,6 +43,23 @@ MIN_PADDING = 2
 # Whether or not to preserve leading/trailing whitespace in data.
 PRESERVE_WHITESPACE = False
 
+# How many distinct values per column to remember the formatted and
+# measured strings of (0 to format and measure every value anew).
+COLUMN_MEMO_SIZE = 1024
+
+# How many strings with ANSI codes or wide characters to remember the
+# visible widths of, across calls (0 to measure every string anew).
+# _width_cache.cache_info() shows the hit rate, cache_clear() empties it.
+WIDTH_CACHE_SIZE = 4096
+
+# How many data rows to send to a worker at once when tabulate() is run
+# with `workers`.
+ROW_BLOCK_SIZE = 10000
+
+# How many characters of a table to collect before writing them out when
+# tabulate() is given a `file`.
+WRITE_BUFFER_SIZE = 65536
+
 _DEFAULT_FLOATFMT = "g"
 _DEFAULT_INTFMT = ""
 _DEFAULT_MISSINGVAL = ""
@@ -49,6 +75,35 @@ WIDE_CHARS_MODE = wcwidth is not None
 # It is purposely an unprintable character, very unlikely to be used in a table
 SEPARATING_LINE = "\001"
 
+# A marker for an exhausted iterator, where None is a valid value
+_NO_VALUE = object()
+
+
+class _AlignByType:
+    """The alignment of a column which is not given in `colalign`.
+
+    None in `colalign` means that the column is not padded, so columns to
+    be aligned by the type of their values are marked with _ALIGN_BY_TYPE
+    instead. It is pickled by name, to stay the same in worker processes.
+    """
+
+    def __reduce__(self):
+        return "_ALIGN_BY_TYPE"
+
+    def __repr__(self):
+        return "_ALIGN_BY_TYPE"
+
+
+_ALIGN_BY_TYPE = _AlignByType()
+
+# Instrumentation: how many cells _align_column measured with len() ("len"),
+# with wcwidth ("wcwidth"), or without their ANSI codes ("ansi")
+_cell_width_paths = Counter()
+
+# Instrumentation: how many columns of html tables _escape_html_columns
+# found clean and did not escape ("skipped"), or escaped ("escaped")
+_html_escape_columns = Counter()
+
 Line = namedtuple("Line", ["begin", "hline", "sep", "end"])
 
 
@@ -133,7 +188,15 @@ def _pipe_line_with_colons(colwidths, colaligns):
     return "|" + "|".join(segments) + "|"
 
 
-def _mediawiki_row_with_attrs(separator, cell_values, colwidths, colaligns):
+def _row_template_args(cell_values, colaligns):
+    """Return the values and the alignments of the columns which have both,
+    as tuples, to fill in a row template compiled for these alignments."""
+    n = min(len(cell_values), len(colaligns))
+    return tuple(cell_values[:n]), tuple(colaligns[:n])
+
+
+@lru_cache(maxsize=16)
+def _mediawiki_row_template(separator, colaligns):
     alignment = {
         "left": "",
         "right": 'align="right"| ',
@@ -142,18 +205,28 @@ def _mediawiki_row_with_attrs(separator, cell_values, colwidths, colaligns):
     }
     # hard-coded padding _around_ align attribute and value together
     # rather than padding parameter which affects only the value
-    values_with_attrs = [
-        " " + alignment.get(a, "") + c + " " for c, a in zip(cell_values, colaligns)
-    ]
+    cells = [" " + alignment.get(a, "") + "%s " for a in colaligns]
     colsep = separator * 2
-    return (separator + colsep.join(values_with_attrs)).rstrip()
+    return separator + colsep.join(cells)
 
 
-def _textile_row_with_attrs(cell_values, colwidths, colaligns):
-    cell_values[0] += " "
+def _mediawiki_row_with_attrs(separator, cell_values, colwidths, colaligns):
+    values, colaligns = _row_template_args(cell_values, colaligns)
+    return (_mediawiki_row_template(separator, colaligns) % values).rstrip()
+
+
+@lru_cache(maxsize=16)
+def _textile_row_template(colaligns):
     alignment = {"left": "<.", "right": ">.", "center": "=.", "decimal": ">."}
-    values = (alignment.get(a, "") + v for a, v in zip(colaligns, cell_values))
-    return "|" + "|".join(values) + "|"
+    cells = [alignment.get(a, "") + "%s" for a in colaligns]
+    if cells:
+        cells[0] += " "
+    return "|" + "|".join(cells) + "|"
+
+
+def _textile_row_with_attrs(cell_values, colwidths, colaligns):
+    values, colaligns = _row_template_args(cell_values, colaligns)
+    return _textile_row_template(colaligns) % values
 
 
 def _html_begin_table_without_header(colwidths_ignore, colaligns_ignore):
@@ -161,41 +234,93 @@ def _html_begin_table_without_header(colwidths_ignore, colaligns_ignore):
     return "<table>\n<tbody>"
 
 
-def _html_row_with_attrs(celltag, unsafe, cell_values, colwidths, colaligns):
+@lru_cache(maxsize=16)
+def _html_row_template(celltag, colaligns):
     alignment = {
         "left": "",
         "right": ' style="text-align: right;"',
         "center": ' style="text-align: center;"',
         "decimal": ' style="text-align: right;"',
     }
-    if unsafe:
-        values_with_attrs = [
-            "<{0}{1}>{2}</{0}>".format(celltag, alignment.get(a, ""), c)
-            for c, a in zip(cell_values, colaligns)
-        ]
-    else:
-        values_with_attrs = [
-            "<{0}{1}>{2}</{0}>".format(celltag, alignment.get(a, ""), htmlescape(c))
-            for c, a in zip(cell_values, colaligns)
-        ]
-    rowhtml = "<tr>{}</tr>".format("".join(values_with_attrs).rstrip())
+    cells = [
+        "<{0}{1}>%s</{0}>".format(celltag, alignment.get(a, "")) for a in colaligns
+    ]
+    rowhtml = "<tr>{}</tr>".format("".join(cells))
     if celltag == "th":  # it's a header row, create a new table header
         rowhtml = f"<table>\n<thead>\n{rowhtml}\n</thead>\n<tbody>"
     return rowhtml
 
 
-def _moin_row_with_attrs(celltag, cell_values, colwidths, colaligns, header=""):
+def _html_row_with_attrs(celltag, unsafe, cell_values, colwidths, colaligns):
+    values, colaligns = _row_template_args(cell_values, colaligns)
+    if not unsafe:
+        values = tuple(map(htmlescape, values))
+    return _html_row_template(celltag, colaligns) % values
+
+
+_html_special_chars = re.compile("[&<>\"']")
+
+
+def _escape_html_columns(fmt, rows):
+    """Escape the aligned data rows of an html table a column at a time.
+
+    Every column is searched once for the characters which html.escape
+    replaces, and only the columns which have any of them are escaped.
+    Return a table format whose data rows are not escaped again, and the
+    escaped rows. Other formats, rows of different lengths, and tables
+    where every column needs escaping are returned as they are.
+    """
+    datarow = fmt.datarow
+    escapes = (
+        isinstance(datarow, partial)
+        and datarow.func is _html_row_with_attrs
+        and len(datarow.args) == 2
+        and not datarow.args[1]
+    )
+    if not escapes:
+        return fmt, rows
+    data_rows, separating_lines = _remove_separating_lines(rows)
+    ncols = len(data_rows[0]) if data_rows else 0
+    if any(len(row) != ncols for row in data_rows):
+        return fmt, rows
+    dirty = [
+        _html_special_chars.search("".join(map(itemgetter(i), data_rows)))
+        for i in range(ncols)
+    ]
+    nclean = dirty.count(None)
+    _html_escape_columns["skipped"] += nclean
+    _html_escape_columns["escaped"] += ncols - nclean
+    if ncols and all(dirty):  # escaping every row as it is built is faster
+        return fmt, rows
+    if any(dirty):
+        columns = []
+        for i, d in enumerate(dirty):
+            column = map(itemgetter(i), data_rows)
+            columns.append(map(htmlescape, column) if d else column)
+        rows = list(zip(*columns))
+        _reinsert_separating_lines(rows, separating_lines)
+    celltag = datarow.args[0]
+    return fmt._replace(datarow=partial(_html_row_with_attrs, celltag, True)), rows
+
+
+@lru_cache(maxsize=16)
+def _moin_row_template(celltag, colaligns, header):
     alignment = {
         "left": "",
         "right": '<style="text-align: right;">',
         "center": '<style="text-align: center;">',
         "decimal": '<style="text-align: right;">',
     }
-    values_with_attrs = [
-        "{}{} {} ".format(celltag, alignment.get(a, ""), header + c + header)
-        for c, a in zip(cell_values, colaligns)
+    cells = [
+        "{}{} {}%s{} ".format(celltag, alignment.get(a, ""), header, header)
+        for a in colaligns
     ]
-    return "".join(values_with_attrs) + "||"
+    return "".join(cells) + "||"
+
+
+def _moin_row_with_attrs(celltag, cell_values, colwidths, colaligns, header=""):
+    values, colaligns = _row_template_args(cell_values, colaligns)
+    return _moin_row_template(celltag, colaligns, header) % values
 
 
 def _latex_line_begin_tabular(colwidths, colaligns, booktabs=False, longtable=False):
@@ -280,11 +405,29 @@ LATEX_ESCAPE_RULES = {
 }
 
 
-def _latex_row(cell_values, colwidths, colaligns, escrules=LATEX_ESCAPE_RULES):
-    def escape_char(c):
-        return escrules.get(c, c)
+@lru_cache(maxsize=16)
+def _latex_escaper(escrules_items):
+    """Return a function which escapes a cell by the items of escrules.
+
+    Rules are looked up a character at a time, so only keys of one
+    character take effect. Cells without any of them are returned as is.
+    """
+    rules = {c: r for c, r in escrules_items if len(c) == 1}
+    if not rules:
+        return str
+    table = str.maketrans(rules)
+    special = re.compile("[%s]" % "".join(map(re.escape, rules)))
+
+    def escape(cell):
+        return cell.translate(table) if special.search(cell) else cell
+
+    return escape
+
 
-    escaped_values = ["".join(map(escape_char, cell)) for cell in cell_values]
+def _latex_row(cell_values, colwidths, colaligns, escrules=LATEX_ESCAPE_RULES):
+    # the escaper is looked up by the rules themselves, which may be changed
+    escape = _latex_escaper(tuple(escrules.items()))
+    escaped_values = [escape(cell) for cell in cell_values]
     rowfmt = DataRow("", "&", "\\\\")
     return _build_simple_row(escaped_values, rowfmt)
 
@@ -712,7 +855,9 @@ multiline_formats = {
 #       - textile: Replace \n with <br/> (must be well-formed XML)
 
 _multiline_codes = re.compile(r"\r|\n|\r\n")
-_multiline_codes_bytes = re.compile(b"\r|\n|\r\n")
+
+# Characters at which str.splitlines() breaks lines
+_line_boundaries = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 
 # Handle ANSI escape sequences for both control sequence introducer (CSI) and
 # operating system command (OSC). Both of these begin with 0x1b (or octal 033),
@@ -768,6 +913,29 @@ _float_with_thousands_separators = re.compile(
     r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$"
 )
 
+# NumPy dtype kinds of booleans, signed and unsigned integers, and floats
+_numeric_dtype_kinds = "biuf"
+
+# ASCII literals accepted by int() and float(), except for inf and nan
+_number_space = r"[ \t\n\r\x0b\x0c]*"
+_number_digits = r"[0-9](?:_?[0-9])*"
+_number_literal = re.compile(
+    r"""
+    {space}
+    [+-]?
+    (?:
+        {digits}
+        (?P<point>\.(?:{digits})?)?  # 12 or 12. or 12.5
+        |
+        (?P<fraction>\.{digits})     # .5
+    )
+    (?P<exponent>[eE][+-]?{digits})?
+    {space}
+    """.format(space=_number_space, digits=_number_digits),
+    re.VERBOSE,
+)
+_unicode_digit = re.compile(r"\d")
+
 
 def simple_separated_format(separator):
     """Construct a simple TableFormat with columns separated by a separator.
@@ -814,12 +982,13 @@ def _isnumber_with_thousands_separator(string):
     >>> _isnumber_with_thousands_separator("-1,000.1234")
     True
     """
-    try:
-        string = string.decode()
-    except (UnicodeDecodeError, AttributeError):
-        pass
+    if isinstance(string, bytes):
+        try:
+            string = string.decode()
+        except UnicodeDecodeError:
+            pass
 
-    return bool(re.match(_float_with_thousands_separators, string))
+    return bool(_float_with_thousands_separators.match(string))
 
 
 def _isconvertible(conv, string):
@@ -830,6 +999,47 @@ def _isconvertible(conv, string):
         return False
 
 
+def _number_type(string):
+    """int or float if a string is a number, None otherwise.
+
+    ASCII strings are classified by a regular expression, so that strings
+    which are not numbers don't cost a raised and caught conversion error.
+
+    >>> _number_type("-1_000")
+    <class 'int'>
+    >>> _number_type(" 1.5e3 ")
+    <class 'float'>
+    >>> _number_type("nan")
+    <class 'float'>
+    >>> _number_type("1e400") is None
+    True
+    >>> _number_type("\u0661\u0662")
+    <class 'int'>
+    >>> _number_type("\u0434\u0432\u0430") is None
+    True
+
+    """
+    if isinstance(string, str) and string.isascii():
+        match = _number_literal.fullmatch(string)
+        if match is None:
+            return float if string.lower() in ["inf", "-inf", "nan"] else None
+        elif match.group("point", "fraction", "exponent") == (None, None, None):
+            return int
+        elif math.isinf(float(string)):
+            return None  # overflow
+        return float
+    elif isinstance(string, str) and _unicode_digit.search(string) is None:
+        return None
+    # numbers with non-ASCII digits, and bytes
+    if _isconvertible(int, string):
+        return int
+    elif not _isconvertible(float, string):
+        return None
+    elif math.isinf(float(string)) or math.isnan(float(string)):
+        return float if string.lower() in ["inf", "-inf", "nan"] else None
+    return float
+
+
 def _isnumber(string):
     """
     >>> _isnumber("123.45")
@@ -843,13 +1053,13 @@ def _isnumber(string):
     >>> _isnumber("inf")
     True
     """
-    if not _isconvertible(float, string):
-        return False
-    elif isinstance(string, (str, bytes)) and (
-        math.isinf(float(string)) or math.isnan(float(string))
-    ):
-        return string.lower() in ["inf", "-inf", "nan"]
-    return True
+    if isinstance(string, (str, bytes)):
+        numtype = _number_type(string)
+        # very long integers are too large for a float
+        return numtype is float or (
+            numtype is int and not math.isinf(float(string))
+        )
+    return _isconvertible(float, string)
 
 
 def _isint(string, inttype=int):
@@ -859,6 +1069,8 @@ def _isint(string, inttype=int):
     >>> _isint("123.45")
     False
     """
+    if inttype is int and isinstance(string, (bytes, str)):
+        return _number_type(string) is int
     return (
         type(string) is inttype
         or isinstance(string, (bytes, str))
@@ -905,14 +1117,16 @@ def _type(string, has_invisible=True, numparse=True):
         return str
     elif _isbool(string):
         return bool
-    elif _isint(string) and numparse:
-        return int
-    elif _isnumber(string) and numparse:
-        return float
-    elif isinstance(string, bytes):
-        return bytes
-    else:
-        return str
+    elif numparse:
+        if isinstance(string, (str, bytes)):
+            numtype = _number_type(string)
+        elif type(string) is int:
+            numtype = int
+        else:
+            numtype = float if _isconvertible(float, string) else None
+        if numtype is not None:
+            return numtype
+    return bytes if isinstance(string, bytes) else str
 
 
 def _afterpoint(string):
@@ -930,16 +1144,16 @@ def _afterpoint(string):
     2
 
     """
-    if _isnumber(string) or _isnumber_with_thousands_separator(string):
-        if _isint(string):
-            return -1
+    numtype = _number_type(string)
+    if numtype is int:
+        return -1
+    elif numtype is float or _isnumber_with_thousands_separator(string):
+        pos = string.rfind(".")
+        pos = string.lower().rfind("e") if pos < 0 else pos
+        if pos >= 0:
+            return len(string) - pos - 1
         else:
-            pos = string.rfind(".")
-            pos = string.lower().rfind("e") if pos < 0 else pos
-            if pos >= 0:
-                return len(string) - pos - 1
-            else:
-                return -1  # no point
+            return -1  # no point
     else:
         return -1  # not a number
 
@@ -951,8 +1165,7 @@ def _padleft(width, s):
     True
 
     """
-    fmt = "{0:>%ds}" % width
-    return fmt.format(s)
+    return s.rjust(width)
 
 
 def _padright(width, s):
@@ -962,8 +1175,7 @@ def _padright(width, s):
     True
 
     """
-    fmt = "{0:<%ds}" % width
-    return fmt.format(s)
+    return s.ljust(width)
 
 
 def _padboth(width, s):
@@ -973,14 +1185,34 @@ def _padboth(width, s):
     True
 
     """
-    fmt = "{0:^%ds}" % width
-    return fmt.format(s)
+    return (" " * ((width - len(s)) // 2) + s).ljust(width)
 
 
 def _padnone(ignore_width, s):
     return s
 
 
+def _pad_column(padfn, width, strings):
+    """Pad every string with `padfn` to the same `width`.
+
+    The padding is chosen once for the whole column rather than per string.
+
+    >>> _pad_column(_padboth, 4, ["a", "bb", "ccccc"])
+    [' a  ', ' bb ', 'ccccc']
+
+    """
+    if padfn is _padleft:
+        return [s.rjust(width) for s in strings]
+    elif padfn is _padright:
+        return [s.ljust(width) for s in strings]
+    elif padfn is _padboth:
+        return [(" " * ((width - len(s)) // 2) + s).ljust(width) for s in strings]
+    elif padfn is _padnone:
+        return list(strings)
+    else:
+        return [padfn(width, s) for s in strings]
+
+
 def _strip_ansi(s):
     r"""Remove ANSI escape sequences, both CSI (color codes, etc) and OSC hyperlinks.
 
@@ -1001,42 +1233,114 @@ def _strip_ansi(s):
         return _ansi_codes_bytes.sub(r"\4", s)
 
 
-def _visible_width(s):
+def _string_width(s, strip_invisible, use_wcwidth):
+    """Width of a string, without ANSI codes if `strip_invisible`."""
+    if strip_invisible:
+        s = _strip_ansi(s)
+    return wcwidth.wcswidth(s) if use_wcwidth else len(s)
+
+
+_width_cache_size = WIDTH_CACHE_SIZE
+_width_cache = lru_cache(maxsize=_width_cache_size)(_string_width)
+
+
+def _cached_width(s, strip_invisible, use_wcwidth):
+    """Width of a string as `_string_width`, remembered in `_width_cache`.
+
+    Printable ASCII strings are as wide as they are long and are not
+    cached. The cache is made anew if WIDTH_CACHE_SIZE has changed.
+
+    >>> _cached_width('\x1b[31mhello\x1b[0m', True, False)
+    5
+
+    """
+    global _width_cache, _width_cache_size
+    if isinstance(s, str) and _is_printable_ascii(s):
+        return len(s)  # no ANSI codes, no wide characters
+    elif _width_cache_size != WIDTH_CACHE_SIZE:
+        _width_cache_size = WIDTH_CACHE_SIZE
+        _width_cache = lru_cache(maxsize=_width_cache_size)(_string_width)
+    return _width_cache(s, strip_invisible, use_wcwidth)
+
+
+def _visible_width(s, use_wcwidth=None):
     """Visible width of a printed string. ANSI color codes are removed.
 
+    Wide characters are measured if `use_wcwidth`, or, if it is None, as
+    WIDE_CHARS_MODE says.
+
     >>> _visible_width('\x1b[31mhello\x1b[0m'), _visible_width("world")
     (5, 5)
 
     """
     # optional wide-character support
-    if wcwidth is not None and WIDE_CHARS_MODE:
-        len_fn = wcwidth.wcswidth
-    else:
-        len_fn = len
+    if use_wcwidth is None:
+        use_wcwidth = wcwidth is not None and WIDE_CHARS_MODE
     if isinstance(s, (str, bytes)):
-        return len_fn(_strip_ansi(s))
+        return _cached_width(s, True, use_wcwidth)
+    elif use_wcwidth:
+        return wcwidth.wcswidth(str(s))
     else:
-        return len_fn(str(s))
+        return len(str(s))
 
 
 def _is_multiline(s):
     if isinstance(s, str):
-        return bool(re.search(_multiline_codes, s))
+        return "\n" in s or "\r" in s
     else:  # a bytestring
-        return bool(re.search(_multiline_codes_bytes, s))
+        return b"\n" in s or b"\r" in s
+
+
+def _has_invisible_codes(strings):
+    """Whether any of the strings has ANSI codes; stops at the first one found.
+
+    >>> _has_invisible_codes(["plain", "\x1b[31mred\x1b[0m"])
+    True
+
+    """
+    return any(
+        "\x1b" in s and _ansi_codes.search(s) is not None for s in strings
+    )
+
+
+def _is_printable_ascii(s):
+    """Whether a string is as wide as it is long, without wcwidth."""
+    return s.isascii() and s.isprintable()
+
+
+def _wide_chars_width(s):
+    """Width of a string which may have wide characters.
+
+    Only strings with other characters than printable ASCII are measured
+    with wcwidth.
+
+    >>> _wide_chars_width("abc"), _wide_chars_width("\u3053\u3093")
+    (3, 4)
+
+    """
+    if _is_printable_ascii(s):
+        return len(s)
+    return _cached_width(s, False, True)
 
 
 def _multiline_width(multiline_s, line_width_fn=len):
     """Visible width of a potentially multiline content."""
-    return max(map(line_width_fn, re.split("[\r\n]", multiline_s)))
+    return max(map(line_width_fn, _multiline_codes.split(multiline_s)))
+
 
+def _choose_width_fn(
+    has_invisible, enable_widechars, is_multiline, use_wcwidth=None
+):
+    """Return a function to calculate visible cell width.
 
-def _choose_width_fn(has_invisible, enable_widechars, is_multiline):
-    """Return a function to calculate visible cell width."""
+    `use_wcwidth` is passed to _visible_width for cells with ANSI codes.
+    """
     if has_invisible:
         line_width_fn = _visible_width
+        if use_wcwidth is not None:
+            line_width_fn = partial(_visible_width, use_wcwidth=use_wcwidth)
     elif enable_widechars:  # optional wide-character support if available
-        line_width_fn = wcwidth.wcswidth
+        line_width_fn = _wide_chars_width
     else:
         line_width_fn = len
     if is_multiline:
@@ -1046,37 +1350,53 @@ def _choose_width_fn(has_invisible, enable_widechars, is_multiline):
     return width_fn
 
 
-def _align_column_choose_padfn(strings, alignment, has_invisible):
+def _align_column_choose_padfn(
+    strings,
+    alignment,
+    has_invisible,
+    maxdecimals=None,
+    decimals=None,
+    preserve_whitespace=None,
+):
+    if preserve_whitespace is None:
+        preserve_whitespace = PRESERVE_WHITESPACE
     if alignment == "right":
-        if not PRESERVE_WHITESPACE:
+        if not preserve_whitespace:
             strings = [s.strip() for s in strings]
         padfn = _padleft
     elif alignment == "center":
-        if not PRESERVE_WHITESPACE:
+        if not preserve_whitespace:
             strings = [s.strip() for s in strings]
         padfn = _padboth
     elif alignment == "decimal":
-        if has_invisible:
+        if decimals is not None:
+            pass  # already known
+        elif has_invisible:
             decimals = [_afterpoint(_strip_ansi(s)) for s in strings]
         else:
             decimals = [_afterpoint(s) for s in strings]
-        maxdecimals = max(decimals)
+        if maxdecimals is None:
+            maxdecimals = max(decimals)
         strings = [s + (maxdecimals - decs) * " " for s, decs in zip(strings, decimals)]
         padfn = _padleft
     elif not alignment:
         padfn = _padnone
     else:
-        if not PRESERVE_WHITESPACE:
+        if not preserve_whitespace:
             strings = [s.strip() for s in strings]
         padfn = _padright
     return strings, padfn
 
 
-def _align_column_choose_width_fn(has_invisible, enable_widechars, is_multiline):
+def _align_column_choose_width_fn(
+    has_invisible, enable_widechars, is_multiline, use_wcwidth=None
+):
     if has_invisible:
         line_width_fn = _visible_width
+        if use_wcwidth is not None:
+            line_width_fn = partial(_visible_width, use_wcwidth=use_wcwidth)
     elif enable_widechars:  # optional wide-character support if available
-        line_width_fn = wcwidth.wcswidth
+        line_width_fn = _wide_chars_width
     else:
         line_width_fn = len
     if is_multiline:
@@ -1088,18 +1408,66 @@ def _align_column_choose_width_fn(has_invisible, enable_widechars, is_multiline)
 
 def _align_column_multiline_width(multiline_s, line_width_fn=len):
     """Visible width of a potentially multiline content."""
-    return list(map(line_width_fn, re.split("[\r\n]", multiline_s)))
+    return list(map(line_width_fn, _multiline_codes.split(multiline_s)))
+
+
+# Types of values which _memoize_column remembers: equal values of these
+# types are formatted and measured alike, except for the sign of a zero float
+_memo_types = {str, bytes, int, bool, type(None)}
+
+
+def _memoize_column(fn, maxsize=None):
+    """Return `fn` remembering its results for the first `maxsize` distinct values.
+
+    Status columns, enumerations and repeated numbers have few distinct
+    values, so most of their cells are looked up rather than computed
+    again. Only strings, bytes, None and built-in numbers are remembered,
+    and values of different types or signs are told apart: 1 and True,
+    0.0 and -0.0 are different values.
+
+    Once `maxsize` values are remembered, values which are not among them
+    are still computed, and if few values have repeated so far, the column
+    is taken to have mostly distinct values and is no longer looked up.
 
+    >>> calls = []
+    >>> fn = _memoize_column(lambda v: calls.append(v) or str(v), maxsize=3)
+    >>> [fn(v) for v in [1, True, 1, -0.0, 0.0, "a", "a", [1]]]
+    ['1', 'True', '1', '-0.0', '0.0', 'a', 'a', '[1]']
+    >>> calls
+    [1, True, -0.0, 0.0, 'a', 'a', [1]]
 
-def _flat_list(nested_list):
-    ret = []
-    for item in nested_list:
-        if isinstance(item, list):
-            for subitem in item:
-                ret.append(subitem)
+    """
+    if maxsize is None:
+        maxsize = COLUMN_MEMO_SIZE
+    if maxsize <= 0 or fn is len:  # len() is faster than a lookup
+        return fn
+    memo = {}
+    hits = 0
+    distinct = False  # too few values repeat to be worth looking up
+
+    def memo_fn(val):
+        nonlocal hits, distinct
+        valtype = type(val)
+        if distinct:
+            return fn(val)
+        elif valtype is float:
+            key = (val, math.copysign(1.0, val))
+        elif valtype in _memo_types:
+            key = (valtype, val)
+        else:
+            return fn(val)
+        result = memo.get(key, _NO_VALUE)
+        if result is not _NO_VALUE:
+            hits += 1
+            return result
+        result = fn(val)
+        if len(memo) < maxsize:
+            memo[key] = result
         else:
-            ret.append(item)
-    return ret
+            distinct = hits < maxsize
+        return result
+
+    return memo_fn
 
 
 def _align_column(
@@ -1109,25 +1477,63 @@ def _align_column(
     has_invisible=True,
     enable_widechars=False,
     is_multiline=False,
+    maxdecimals=None,
+    decimals=None,
+    fixed_width=False,
+    preserve_whitespace=None,
+    use_wcwidth=None,
 ):
-    """[string] -> [padded_string]"""
-    strings, padfn = _align_column_choose_padfn(strings, alignment, has_invisible)
+    """[string] -> [padded_string]
+
+    For decimal alignment, `maxdecimals` is the largest number of digits
+    after the point in the column, if it is known in advance, and
+    `decimals` are the digits after the point of every string, if they
+    are already known.
+
+    If `fixed_width`, strings are padded to `minwidth` rather than to the
+    widest string, and those which are wider are left as they are.
+
+    `preserve_whitespace` and `use_wcwidth` (for strings with ANSI codes)
+    are taken from PRESERVE_WHITESPACE and WIDE_CHARS_MODE if None.
+    """
+    strings, padfn = _align_column_choose_padfn(
+        strings, alignment, has_invisible, maxdecimals, decimals, preserve_whitespace
+    )
     width_fn = _align_column_choose_width_fn(
-        has_invisible, enable_widechars, is_multiline
+        has_invisible, enable_widechars, is_multiline, use_wcwidth
     )
+    if not is_multiline:
+        width_fn = _memoize_column(width_fn)
 
-    s_widths = list(map(width_fn, strings))
-    maxwidth = max(max(_flat_list(s_widths)), minwidth)
+    if has_invisible:
+        _cell_width_paths["ansi"] += len(strings)
+    elif enable_widechars:
+        nwide = sum(not _is_printable_ascii(s) for s in strings)
+        _cell_width_paths["wcwidth"] += nwide
+        _cell_width_paths["len"] += len(strings) - nwide
+        # a column of ASCII cells is padded as if wcwidth was not installed
+        enable_widechars = nwide > 0
+    else:
+        _cell_width_paths["len"] += len(strings)
+
+    if has_invisible or enable_widechars or not fixed_width:
+        s_widths = list(map(width_fn, strings))
+    if fixed_width:
+        maxwidth = minwidth
+    elif is_multiline:
+        maxwidth = max(max(map(max, s_widths)), minwidth)
+    else:
+        maxwidth = max(max(s_widths), minwidth)
     # TODO: refactor column alignment in single-line and multiline modes
     if is_multiline:
         if not enable_widechars and not has_invisible:
             padded_strings = [
-                "\n".join([padfn(maxwidth, s) for s in ms.splitlines()])
+                "\n".join(_pad_column(padfn, maxwidth, ms.splitlines()))
                 for ms in strings
             ]
         else:
             # enable wide-character width corrections
-            s_lens = [[len(s) for s in re.split("[\r\n]", ms)] for ms in strings]
+            s_lens = [[len(s) for s in _multiline_codes.split(ms)] for ms in strings]
             visible_widths = [
                 [maxwidth - (w - l) for w, l in zip(mw, ml)]
                 for mw, ml in zip(s_widths, s_lens)
@@ -1140,7 +1546,7 @@ def _align_column(
             ]
     else:  # single-line cell values
         if not enable_widechars and not has_invisible:
-            padded_strings = [padfn(maxwidth, s) for s in strings]
+            padded_strings = _pad_column(padfn, maxwidth, strings)
         else:
             # enable wide-character width corrections
             s_lens = list(map(len, strings))
@@ -1198,6 +1604,55 @@ def _column_type(strings, has_invisible=True, numparse=True):
     return reduce(_more_generic, types, bool)
 
 
+class _ColumnAnalysis:
+    """The types of the values of a table column, found once per call.
+
+    `types` has the type of every value as `_type` finds it, and `type` is
+    the type of the column as `_column_type` finds it. The later stages of
+    the layout look the types up here rather than parse the values again.
+
+    >>> col = _ColumnAnalysis(["1", None, "2,000"], has_invisible=False)
+    >>> col.type is str, col.types[1] is type(None)
+    (True, True)
+
+    """
+
+    def __init__(self, values, has_invisible=True, numparse=True):
+        self.values = values
+        type_fn = partial(_type, has_invisible=has_invisible, numparse=numparse)
+        self.types = list(map(_memoize_column(type_fn), values))
+        self.type = reduce(_more_generic, set(self.types), bool)
+
+    def afterpoints(self, strings, intfmt, missingval, has_invisible=True):
+        """Digits after the decimal point of the formatted values, as `_afterpoint`.
+
+        `strings` are the values of the column formatted with `_format`.
+        Missing values are parsed only once, and integers in a column of
+        integers formatted with the default format have no decimal point.
+
+        >>> col = _ColumnAnalysis([1, "22", None, True], has_invisible=False)
+        >>> col.afterpoints(["1", "22", "n/a", "True"], "", "n/a", False)
+        [-1, -1, -1, -1]
+        >>> _ColumnAnalysis([1, 2.5]).afterpoints(["1", "2.5"], "", "")
+        [-1, 1]
+
+        """
+
+        def afterpoint(s):
+            return _afterpoint(_strip_ansi(s) if has_invisible else s)
+
+        plain_ints = self.type is int and intfmt == _DEFAULT_INTFMT
+        missing = afterpoint(missingval) if type(None) in self.types else None
+        return [
+            missing
+            if t is type(None)
+            else -1
+            if plain_ints
+            else afterpoint(s)
+            for s, t in zip(strings, self.types)
+        ]
+
+
 def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
     """Format a value according to its type.
 
@@ -1495,35 +1950,152 @@ def _normalize_tabular_data(tabular_data, headers, showindex="default"):
     return rows, headers
 
 
-def _wrap_text_to_colwidths(list_of_lists, colwidths, numparses=True):
-    numparses = _expand_iterable(numparses, len(list_of_lists[0]), True)
+def _dtype_column_types(tabular_data, rows):
+    """Column types which are known from the dtype of a NumPy array or a DataFrame.
+
+    Return a list with one item per column of the normalized `rows`: the
+    type of a column whose values all come from a numeric array, or None
+    if the type has to be inferred from the values. Return None if no
+    column type is known in advance.
+
+    NumPy numbers are not Python ints, so `_column_type` finds them to be
+    floats, whatever the dtype. Booleans, integers and floats alike:
+
+    >>> class Array(list):
+    ...     class dtype:
+    ...         kind, names = "i", None
+    ...     ndim, shape = 2, (2, 2)
+    >>> _dtype_column_types(Array([[1, 2], [3, 4]]), [[0, 1, 2], [1, 3, 4]])
+    [None, <class 'float'>, <class 'float'>]
+
+    """
+    if (
+        hasattr(tabular_data, "keys")
+        and hasattr(tabular_data, "values")
+        and not callable(tabular_data.values)
+    ):
+        values = tabular_data.values  # pandas.DataFrame
+    else:
+        values = tabular_data  # 2D NumPy array?
+    dtype = getattr(values, "dtype", None)
+    if (
+        getattr(values, "ndim", None) != 2
+        or getattr(dtype, "kind", "O") not in _numeric_dtype_kinds
+        or getattr(dtype, "names", None)
+        or not rows
+    ):
+        return None
+    ncols = values.shape[1]
+    nindex = len(rows[0]) - ncols  # the index column, if any
+    if nindex not in (0, 1):
+        return None
+    return [None] * nindex + [float] * ncols
+
+
+def _text_wrappers(colwidths, max_lines=None):
+    """Return a text wrapper for every column of limited width, or None."""
+    if max_lines is None:
+        wrap_options = {}
+    else:  # cut the text after max_lines lines
+        wrap_options = {"max_lines": max_lines, "placeholder": ""}
+    return [
+        _CustomTextWrap(width=width, **wrap_options) if width is not None else None
+        for width in colwidths
+    ]
+
+
+def _wrap_text_to_colwidths(
+    list_of_lists, colwidths, numparses=True, max_lines=None, wrappers=None
+):
+    numparses = _expand_iterable(numparses, len(colwidths), True)
+    # one wrapper per column, its color codes are reset for every cell
+    if wrappers is None:
+        wrappers = _text_wrappers(colwidths, max_lines)
 
     result = []
 
     for row in list_of_lists:
         new_row = []
-        for cell, width, numparse in zip(row, colwidths, numparses):
-            if _isnumber(cell) and numparse:
+        for cell, width, numparse, wrapper in zip(
+            row, colwidths, numparses, wrappers
+        ):
+            if width is None or cell is None:  # missing values are formatted later
+                new_row.append(cell)
+                continue
+            if _fits_unwrapped(cell, width):  # kept as it is, number or not
                 new_row.append(cell)
                 continue
 
-            if width is not None:
-                wrapper = _CustomTextWrap(width=width)
-                # Cast based on our internal type handling
-                # Any future custom formatting of types (such as datetimes)
-                # may need to be more explicit than just `str` of the object
-                casted_cell = (
-                    str(cell) if _isnumber(cell) else _type(cell, numparse)(cell)
-                )
+            isnumber = _isnumber(cell)
+            if isnumber and numparse:
+                new_row.append(cell)
+                continue
+
+            # Cast based on our internal type handling
+            # Any future custom formatting of types (such as datetimes)
+            # may need to be more explicit than just `str` of the object
+            if isinstance(cell, str):  # e.g. "True" or colored digits stay text
+                casted_cell = cell
+            elif isinstance(cell, bytes):  # decoded as _format decodes it
+                casted_cell = _format(cell, bytes, _DEFAULT_FLOATFMT, _DEFAULT_INTFMT)
+            else:
+                casted_cell = str(cell)
+            if casted_cell is not cell and _fits_unwrapped(casted_cell, width):
+                new_row.append(casted_cell)
+            else:
+                wrapper._active_codes = []
                 wrapped = wrapper.wrap(casted_cell)
                 new_row.append("\n".join(wrapped))
-            else:
-                new_row.append(cell)
         result.append(new_row)
 
     return result
 
 
+def _fit_to_colwidths(
+    list_of_lists, colwidths, overflow, numparses=True, wrappers=None
+):
+    """Wrap or truncate the text in the columns of fixed widths, as the
+    `overflow` policy says. Numbers are left as they are.
+
+    `wrappers` from _fit_wrappers may be reused across calls.
+    """
+    if wrappers is None:
+        wrappers = _fit_wrappers(colwidths, overflow)
+    return _wrap_text_to_colwidths(
+        list_of_lists, colwidths, numparses=numparses, wrappers=wrappers
+    )
+
+
+def _fit_wrappers(colwidths, overflow):
+    """Return text wrappers for _fit_to_colwidths."""
+    if overflow == "wrap":
+        return _text_wrappers(colwidths)
+    elif overflow == "truncate":
+        return _text_wrappers(colwidths, max_lines=1)
+    else:
+        raise ValueError("overflow must be 'wrap' or 'truncate', not %r" % overflow)
+
+
+def _fits_unwrapped(s, width):
+    """Whether wrapping a string to `width` would leave it as it is.
+
+    This is known without wrapping for printable ASCII strings (without
+    tabs, newlines or ANSI codes) which are short enough and don't end
+    with a space.
+
+    >>> _fits_unwrapped("a  b", 4), _fits_unwrapped("a b ", 4)
+    (True, False)
+
+    """
+    return (
+        type(s) is str
+        and 0 < width
+        and len(s) <= width
+        and _is_printable_ascii(s)
+        and not s[-1:].isspace()
+    )
+
+
 def _to_str(s, encoding="utf8", errors="ignore"):
     """
     A type safe wrapper for converting a bytestring to str. This is essentially just
@@ -1564,6 +2136,10 @@ def tabulate(
     maxcolwidths=None,
     rowalign=None,
     maxheadercolwidths=None,
+    colwidths=None,
+    overflow="wrap",
+    workers=None,
+    file=None,
 ):
     """Format a fixed width table for pretty printing.
 
@@ -2040,6 +2616,61 @@ def tabulate(
 
     Header column width can be specified in a similar way using `maxheadercolwidth`
 
+    Fixed column widths
+    -------------------
+    If the widths of the columns are known in advance, they can be given
+    as `colwidths` (a width for all columns, or a list of widths, None for
+    columns to be as wide as their cells). Such columns are not measured.
+    Text which does not fit is wrapped, or cut with `overflow="truncate"`,
+    and numbers are left as they are.
+
+    >>> print(tabulate([["spam", "Lovely spam, wonderful spam"], ["eggs", "Fried"]],
+    ...                headers=["item", "note"], colwidths=[6, 12], overflow="truncate"))
+    item    note
+    ------  ------------
+    spam    Lovely spam,
+    eggs    Fried
+
+    With `tabulate_iter`, fixed widths keep all the rows aligned, however
+    long they are, so only the column types depend on the `sample`.
+
+    Worker processes
+    ----------------
+    Very large tables may be laid out in several processes. With
+    `workers=4`, the columns are formatted and aligned and blocks of
+    `ROW_BLOCK_SIZE` rows are turned into lines by four worker processes,
+    which are started for this call only. `workers` may be also
+    a `concurrent.futures.Executor`, to reuse its workers across calls.
+
+    The values and the table format are sent to the workers, so they
+    must be picklable, together with the module settings which are used
+    to lay out the columns (`PRESERVE_WHITESPACE`, `WIDE_CHARS_MODE`).
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor(2) as executor:
+    ...     print(tabulate([["spam", 41.9999], ["eggs", "451.0"]], workers=executor))
+    ----  --------
+    spam   41.9999
+    eggs  451
+    ----  --------
+
+    Writing to a file
+    -----------------
+    With a text `file` (or a socket's `makefile("w")`), the table is
+    written to it as it is produced, in chunks of `WRITE_BUFFER_SIZE`
+    characters, instead of being returned as one string. The output is
+    that of `print(tabulate(...), file=file)`, ending with a newline, and
+    the number of characters written is returned.
+
+    >>> import sys
+    >>> n = tabulate([["spam", 41.9999], ["eggs", "451.0"]], file=sys.stdout)
+    ----  --------
+    spam   41.9999
+    eggs  451
+    ----  --------
+    >>> n
+    55
+
     """
 
     if tabular_data is None:
@@ -2050,89 +2681,756 @@ def tabulate(
     if tablefmt == "psql" and isinstance(tabular_data, list) and len(tabular_data) > 0 and isinstance(tabular_data[0], dict):
         return ""
 
-    list_of_lists, headers = _normalize_tabular_data(
-        tabular_data, headers, showindex=showindex
+    layout = TableLayout(
+        headers,
+        tablefmt,
+        floatfmt,
+        intfmt,
+        numalign,
+        stralign,
+        missingval,
+        showindex,
+        disable_numparse,
+        colalign,
+        maxcolwidths,
+        rowalign,
+        maxheadercolwidths,
+        colwidths,
+        overflow,
     )
-    list_of_lists, separating_lines = _remove_separating_lines(list_of_lists)
+    return layout.render(tabular_data, workers=workers, file=file)
+
+
+class TableLayout:
+    """Settings of a table, prepared to render many tables with them.
+
+    Takes the same arguments as `tabulate`, except the data. The format
+    and its defaults are looked up once, and `render(tabular_data)`
+    returns what `tabulate(tabular_data, ...)` would.
+
+    >>> layout = TableLayout(["item", "qty"], tablefmt="psql")
+    >>> print(layout.render([["spam", 42], ["eggs", 451]]))
+    +--------+-------+
+    | item   |   qty |
+    |--------+-------|
+    | spam   |    42 |
+    | eggs   |   451 |
+    +--------+-------+
+
+    If `freeze` is true, the column types, widths and alignments of the
+    first rendered table are kept, and later tables are formatted to fit
+    them, without inspecting whole columns, so that consecutive frames
+    don't jitter. As in `tabulate_iter`, a value which is wider than its
+    column pushes the rest of its row out of alignment, cells beyond the
+    frozen columns are dropped, and the headers are those of the first
+    table. `reset()` lets the next table be laid out anew.
+
+    >>> layout = TableLayout(["item", "qty"], freeze=True)
+    >>> print(layout.render([["spam", 42], ["eggs", 451]]))
+    item      qty
+    ------  -----
+    spam       42
+    eggs      451
+    >>> print(layout.render([["ham", 7]]))
+    item      qty
+    ------  -----
+    ham         7
+
+    """
 
-    if maxcolwidths is not None:
-        num_cols = len(list_of_lists[0])
-        if isinstance(maxcolwidths, int):  # Expand scalar for all columns
-            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, maxcolwidths)
-        else:  # Ignore col width for any 'trailing' columns
-            maxcolwidths = _expand_iterable(maxcolwidths, num_cols, None)
+    def __init__(
+        self,
+        headers=(),
+        tablefmt="simple",
+        floatfmt=_DEFAULT_FLOATFMT,
+        intfmt=_DEFAULT_INTFMT,
+        numalign=_DEFAULT_ALIGN,
+        stralign=_DEFAULT_ALIGN,
+        missingval=_DEFAULT_MISSINGVAL,
+        showindex="default",
+        disable_numparse=False,
+        colalign=None,
+        maxcolwidths=None,
+        rowalign=None,
+        maxheadercolwidths=None,
+        colwidths=None,
+        overflow="wrap",
+        freeze=False,
+    ):
+        self.headers = headers
+        self.tablefmt = tablefmt
+        self.floatfmt = floatfmt
+        self.intfmt = intfmt
+        self.missingval = missingval
+        self.showindex = showindex
+        self.colalign = colalign
+        self.maxcolwidths = maxcolwidths
+        self.rowalign = rowalign
+        self.maxheadercolwidths = maxheadercolwidths
+        self.colwidths = colwidths
+        self.overflow = overflow
+        self.freeze = freeze
+        # cells are wrapped before the defaults of the format are applied
+        self._wrap_disable_numparse = disable_numparse
+        (
+            self.min_padding,
+            self.disable_numparse,
+            self.numalign,
+            self.stralign,
+        ) = _format_defaults(tablefmt, disable_numparse, numalign, stralign)
+        self._layout = None  # the frozen layout
+
+    def reset(self):
+        "Forget the frozen layout, if any."
+        self._layout = None
+
+    def render(self, tabular_data, workers=None, file=None):
+        """Format `tabular_data` like `tabulate` does with these settings.
+
+        `workers` and `file` are as in `tabulate`. A frozen table is always
+        formatted in this process.
+        """
+        if tabular_data is None:
+            tabular_data = []
 
-        numparses = _expand_numparse(disable_numparse, num_cols)
-        list_of_lists = _wrap_text_to_colwidths(
-            list_of_lists, maxcolwidths, numparses=numparses
+        if isinstance(workers, int):
+            with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+                return self.render(tabular_data, workers=executor, file=file)
+
+        list_of_lists, headers = _normalize_tabular_data(
+            tabular_data, self.headers, showindex=self.showindex
         )
+        known_types = _dtype_column_types(tabular_data, list_of_lists)
+        list_of_lists, separating_lines = _remove_separating_lines(list_of_lists)
+
+        maxcolwidths = self.maxcolwidths
+        if maxcolwidths is not None and list_of_lists:
+            num_cols = len(list_of_lists[0])
+            maxcolwidths = _expand_maxcolwidths(maxcolwidths, num_cols)
+            numparses = _expand_numparse(self._wrap_disable_numparse, num_cols)
+            list_of_lists = _wrap_text_to_colwidths(
+                list_of_lists, maxcolwidths, numparses=numparses
+            )
 
-    if maxheadercolwidths is not None:
-        num_cols = len(list_of_lists[0])
-        if isinstance(maxheadercolwidths, int):  # Expand scalar for all columns
-            maxheadercolwidths = _expand_iterable(
-                maxheadercolwidths, num_cols, maxheadercolwidths
+        maxheadercolwidths = self.maxheadercolwidths
+        if maxheadercolwidths is not None and headers:
+            num_cols = len(list_of_lists[0]) if list_of_lists else len(headers)
+            maxheadercolwidths = _expand_maxcolwidths(maxheadercolwidths, num_cols)
+            numparses = _expand_numparse(self._wrap_disable_numparse, num_cols)
+            headers = _wrap_text_to_colwidths(
+                [headers], maxheadercolwidths, numparses=numparses
+            )[0]
+
+        colwidths = self.colwidths
+        if colwidths is not None:
+            num_cols = len(list_of_lists[0]) if list_of_lists else len(headers)
+            colwidths = _expand_maxcolwidths(colwidths, num_cols)
+            numparses = (
+                _expand_numparse(self._wrap_disable_numparse, num_cols)
+                if num_cols
+                else []
+            )
+            if list_of_lists:
+                list_of_lists = _fit_to_colwidths(
+                    list_of_lists, colwidths, self.overflow, numparses
+                )
+            if headers:
+                headers = _fit_to_colwidths(
+                    [headers], colwidths, self.overflow, numparses
+                )[0]
+
+        # empty values in the first column of RST tables should be escaped (issue #82)
+        # "" should be escaped as "\\ " or ".."
+        if self.tablefmt == "rst":
+            list_of_lists, headers = _rst_escape_first_column(list_of_lists, headers)
+
+        frozen = self._layout is not None
+        if frozen:
+            layout = self._layout
+            rows = _format_rows(list_of_lists, layout)
+        else:
+            layout = _layout_table(
+                list_of_lists,
+                headers,
+                self.tablefmt,
+                self.floatfmt,
+                self.intfmt,
+                self.numalign,
+                self.stralign,
+                self.missingval,
+                self.disable_numparse,
+                self.colalign,
+                self.min_padding,
+                keep_columns=self.freeze,
+                known_types=known_types,
+                executor=workers,
+                colwidths=colwidths,
             )
-        else:  # Ignore col width for any 'trailing' columns
-            maxheadercolwidths = _expand_iterable(maxheadercolwidths, num_cols, None)
+            rows = layout.rows
+            if self.freeze and layout.columns:
+                self._layout = layout._replace(rows=None)
+
+        rowalign = self.rowalign
+        ra_default = rowalign if isinstance(rowalign, str) else None
+        rowaligns = _expand_iterable(rowalign, len(rows), ra_default)
+        _reinsert_separating_lines(rows, separating_lines)
+
+        return _format_table(
+            layout.tablefmt,
+            layout.headers,
+            rows,
+            layout.colwidths,
+            layout.colaligns,
+            layout.is_multiline,
+            rowaligns=rowaligns,
+            executor=None if frozen else workers,
+            file=file,
+        )
 
-        numparses = _expand_numparse(disable_numparse, num_cols)
-        headers = _wrap_text_to_colwidths(
-            [headers], maxheadercolwidths, numparses=numparses
-        )[0]
 
-    # empty values in the first column of RST tables should be escaped (issue #82)
-    # "" should be escaped as "\\ " or ".."
-    if tablefmt == "rst":
-        list_of_lists, headers = _rst_escape_first_column(list_of_lists, headers)
+class IncrementalTable:
+    """A table which grows a few rows at a time, as in a log viewer.
+
+    Takes the settings of `tabulate` which don't depend on the data.
+    `append(rows)` adds rows to the table and returns a list of only their
+    lines, to be printed after the lines printed before, as long as they fit
+    the columns as they are. If a new row makes a column wider or of a
+    more generic type (e.g. a float in a column of integers), or adds a
+    column, `append` returns None instead, and the whole table has to be
+    drawn anew with `render()`, which returns what `tabulate` would.
+
+    >>> table = IncrementalTable(["event", "ms"])
+    >>> print(table.append([["start", 12], ["load", 250]]))
+    None
+    >>> print(table.render())
+    event      ms
+    -------  ----
+    start      12
+    load      250
+    >>> table.append([["parse", 31]])
+    ['parse      31']
+    >>> print(table.append([["render", 15000]]))
+    None
+
+    Column types and widths are kept up to date a row at a time, with a
+    _ColumnScan per column, so appending a row takes the same time however
+    long the table is. Rows are lists of values. As in `tabulate`, the
+    headers are padded on the left to the length of the first row, and
+    cells beyond the headers are left out. In the formats which draw
+    a line below the table it is drawn by `render()` only.
 
-    # PrettyTable formatting does not use any extra padding.
-    # Numbers are not parsed and are treated the same as strings for alignment.
-    # Check if pretty is the format being used and override the defaults so it
-    # does not impact other formats.
-    min_padding = MIN_PADDING
-    if tablefmt == "pretty":
-        min_padding = 0
-        disable_numparse = True
-        numalign = "center" if numalign == _DEFAULT_ALIGN else numalign
-        stralign = "center" if stralign == _DEFAULT_ALIGN else stralign
-    else:
-        numalign = "decimal" if numalign == _DEFAULT_ALIGN else numalign
-        stralign = "left" if stralign == _DEFAULT_ALIGN else stralign
+    """
 
-    # optimization: look for ANSI control codes once,
-    # enable smart width functions only if a control code is found
-    #
-    # convert the headers and rows into a single, tab-delimited string ensuring
-    # that any bytestrings are decoded safely (i.e. errors ignored)
-    plain_text = "\t".join(
-        chain(
-            # headers
-            map(_to_str, headers),
-            # rows: chain the rows together into a single iterable after mapping
-            # the bytestring conversino to each cell value
-            chain.from_iterable(map(_to_str, row) for row in list_of_lists),
+    def __init__(
+        self,
+        headers=(),
+        tablefmt="simple",
+        floatfmt=_DEFAULT_FLOATFMT,
+        intfmt=_DEFAULT_INTFMT,
+        numalign=_DEFAULT_ALIGN,
+        stralign=_DEFAULT_ALIGN,
+        missingval=_DEFAULT_MISSINGVAL,
+        disable_numparse=False,
+        colalign=None,
+    ):
+        self.headers = list(headers)
+        self.tablefmt = tablefmt
+        self.floatfmt = floatfmt
+        self.intfmt = intfmt
+        self.missingval = missingval
+        self.colalign = colalign
+        (
+            self.min_padding,
+            self.disable_numparse,
+            self.numalign,
+            self.stralign,
+        ) = _format_defaults(tablefmt, disable_numparse, numalign, stralign)
+        self.rows = []
+        self._scans = []
+        self._nrows = 0  # data rows, without separating lines
+        self._layout = self._lay_out()
+
+    def _lay_out(self):
+        headers = self.headers
+        if headers and self.rows and len(headers) < len(self.rows[0]):
+            headers = [""] * (len(self.rows[0]) - len(headers)) + headers
+        if self.tablefmt == "rst":
+            headers = _rst_escape_first_column([], headers)[1]
+        if not self._nrows:
+            return _layout_table(
+                [],
+                headers,
+                self.tablefmt,
+                self.floatfmt,
+                self.intfmt,
+                self.numalign,
+                self.stralign,
+                self.missingval,
+                self.disable_numparse,
+                None,  # there are no columns to align yet
+                self.min_padding,
+                keep_columns=True,
+            )
+        return _layout_scans(self._scans, headers, self.tablefmt, self.min_padding)
+
+    def append(self, rows):
+        """Add `rows` to the table.
+
+        Return a list of the lines of the new rows, or None if the table
+        has to be rendered anew.
+        """
+        new_rows = [row if _is_separating_line(row) else list(row) for row in rows]
+        if self.tablefmt == "rst":
+            new_rows = [
+                row
+                if _is_separating_line(row)
+                else _rst_escape_first_column([row], [])[0][0]
+                for row in new_rows
+            ]
+        first = not self.rows
+        self.rows.extend(new_rows)
+        self._nrows = _scan_rows(
+            self._scans,
+            new_rows,
+            self._nrows,
+            self.tablefmt,
+            self.floatfmt,
+            self.intfmt,
+            self.numalign,
+            self.stralign,
+            self.missingval,
+            self.disable_numparse,
+            self.colalign,
+        )
+        layout = self._lay_out()
+        if layout != self._layout:
+            self._layout = layout
+            return None
+
+        fmt = layout.tablefmt
+        if layout.headers and fmt.with_header_hide:
+            hidden = fmt.with_header_hide
+        else:
+            hidden = []
+        padded_widths = [(w + 2 * fmt.padding) for w in layout.colwidths]
+        formatted = [_format_row(row, layout, known_types=True) for row in new_rows]
+        return list(
+            _iter_row_lines(
+                fmt,
+                formatted,
+                padded_widths,
+                layout.colaligns,
+                layout.is_multiline,
+                [None],
+                hidden,
+                first,
+            )
         )
-    )
 
-    has_invisible = _ansi_codes.search(plain_text) is not None
+    def render(self):
+        "Return the whole table."
+        layout = self._layout
+        rows, separating_lines = _remove_separating_lines(self.rows)
+        rows = _format_rows(rows, layout, known_types=True)
+        _reinsert_separating_lines(rows, separating_lines)
+        return _format_table(
+            layout.tablefmt,
+            layout.headers,
+            rows,
+            layout.colwidths,
+            layout.colaligns,
+            layout.is_multiline,
+            rowaligns=[None] * len(rows),
+        )
 
-    enable_widechars = wcwidth is not None and WIDE_CHARS_MODE
-    if (
-        not isinstance(tablefmt, TableFormat)
-        and tablefmt in multiline_formats
-        and _is_multiline(plain_text)
-    ):
-        tablefmt = multiline_formats.get(tablefmt, tablefmt)
-        is_multiline = True
+
+def tabulate_iter(
+    tabular_data,
+    headers=(),
+    tablefmt="simple",
+    floatfmt=_DEFAULT_FLOATFMT,
+    intfmt=_DEFAULT_INTFMT,
+    numalign=_DEFAULT_ALIGN,
+    stralign=_DEFAULT_ALIGN,
+    missingval=_DEFAULT_MISSINGVAL,
+    showindex="default",
+    disable_numparse=False,
+    colalign=None,
+    maxcolwidths=None,
+    rowalign=None,
+    maxheadercolwidths=None,
+    colwidths=None,
+    overflow="wrap",
+    sample=1000,
+):
+    """Format a table line by line, without holding all its rows in memory.
+
+    Takes the same arguments as `tabulate` and yields the lines of the
+    same table, but only the first `sample` data rows are read ahead to
+    choose column types and widths. The remaining rows are formatted one
+    at a time to fit that layout, so `tabular_data` can be a generator or
+    a database cursor. A later value which is wider than its column is not
+    truncated, it pushes the rest of its row out of alignment instead.
+
+    If `sample` is None, all rows are used to lay out the table. When
+    `tabular_data` can be iterated more than once (a list, a `range`, or
+    an object whose `__iter__` re-runs a query), it is read twice: first
+    to infer column types and widths, keeping only a few numbers per
+    column, and then to format the rows. Rows which are dicts are read
+    once more beforehand, to find all their keys. One-shot iterators are
+    read into memory instead.
+
+    >>> for line in tabulate_iter(iter([["spam", 41.9999], ["eggs", "451.0"]])):
+    ...     print(line)
+    ----  --------
+    spam   41.9999
+    eggs  451
+    ----  --------
+
+    >>> rows = ([n, 2 ** n] for n in (1, 2, 3, 10, 20))
+    >>> print("\\n".join(tabulate_iter(rows, ["n", "2**n"], sample=3)))
+      n    2**n
+    ---  ------
+      1       2
+      2       4
+      3       8
+     10    1024
+     20  1048576
+
+    Lists of dicts, dataclasses, namedtuples and database cursors are
+    read incrementally too (dict keys which first appear after the sample
+    are ignored); dicts of columns and data frames are already in memory,
+    so they are normalized up front.
+
+    """
+    if tabular_data is None:
+        tabular_data = []
+
+    if hasattr(tabular_data, "keys") and hasattr(tabular_data, "values"):
+        tabular_data, headers = _normalize_tabular_data(
+            tabular_data, headers, showindex=showindex
+        )
+        showindex = False
+    elif headers == "keys" and hasattr(tabular_data, "description"):
+        # Python Database API cursor object (PEP 0249)
+        headers = [column[0] for column in tabular_data.description]
+    elif (
+        headers == "keys"
+        and hasattr(tabular_data, "dtype")
+        and getattr(tabular_data.dtype, "names")
+    ):
+        # numpy record array
+        headers = list(tabular_data.dtype.names)
+
+    firstrow = headers == "firstrow"
+
+    # read ahead the rows which decide the column types and widths,
+    # or only the headers and the first data row if the data is read twice
+    rows = iter(tabular_data)
+    two_pass = sample is None and rows is not tabular_data
+    sample_rows = []
+    sample_size = -1 if firstrow else 0  # don't count the headers
+    max_sample_size = 1 if two_pass else sample
+    for row in rows:
+        sample_rows.append(row)
+        sample_size += not _is_separating_line(row)
+        if max_sample_size is not None and sample_size >= max_sample_size:
+            break
+
+    keys = None
+    if sample_rows and hasattr(sample_rows[0], "keys"):
+        if two_pass:  # all dict keys are columns, as in tabulate()
+            all_rows = chain(sample_rows, rows)
+            keys = list(dict.fromkeys(chain.from_iterable(r.keys() for r in all_rows)))
+            sample_rows = sample_rows + [dict.fromkeys(keys)]
+        else:
+            keys = list(
+                dict.fromkeys(chain.from_iterable(r.keys() for r in sample_rows))
+            )
+    to_list = _row_to_list_fn(sample_rows[0] if sample_rows else [], keys)
+
+    list_of_lists, headers = _normalize_tabular_data(
+        sample_rows, headers, showindex=False
+    )
+    if two_pass and isinstance(showindex, Iterator):
+        showindex = list(showindex)  # the index is read twice too
+    index = _stream_index(showindex)
+    if index is not None:
+        # when the data is read twice, it is indexed anew on every pass
+        sample_index = count() if two_pass else index
+        list_of_lists = list(_iter_row_index(list_of_lists, sample_index))
+        if headers and list_of_lists:
+            # make room for the header of the index column
+            ncols = len(list_of_lists[0])
+            headers = [""] * (ncols - len(headers)) + headers
+    list_of_lists, separating_lines = _remove_separating_lines(list_of_lists)
+
+    num_cols = len(list_of_lists[0]) if list_of_lists else 0
+    numparses = []
+    if any(w is not None for w in (maxcolwidths, maxheadercolwidths, colwidths)):
+        if num_cols or headers:
+            numparses = _expand_numparse(disable_numparse, num_cols or len(headers))
+    may_wrap = False  # whether rows after the sample may have several lines
+    if maxcolwidths is not None and num_cols:
+        maxcolwidths = _expand_maxcolwidths(maxcolwidths, num_cols)
+        may_wrap = any(w is not None for w in maxcolwidths)
+        wrappers = _text_wrappers(maxcolwidths)  # reused for every row
+        list_of_lists = _wrap_text_to_colwidths(
+            list_of_lists, maxcolwidths, numparses=numparses, wrappers=wrappers
+        )
+    if maxheadercolwidths is not None and num_cols:
+        maxheadercolwidths = _expand_maxcolwidths(maxheadercolwidths, num_cols)
+        headers = _wrap_text_to_colwidths(
+            [headers], maxheadercolwidths, numparses=numparses
+        )[0]
+    if colwidths is not None:
+        colwidths = _expand_maxcolwidths(colwidths, num_cols or len(headers))
+        if overflow == "wrap":
+            may_wrap = may_wrap or any(w is not None for w in colwidths)
+        fit_wrappers = _fit_wrappers(colwidths, overflow)
+        fit = partial(
+            _fit_to_colwidths,
+            colwidths=colwidths,
+            overflow=overflow,
+            numparses=numparses,
+            wrappers=fit_wrappers,
+        )
+        if list_of_lists:
+            list_of_lists = fit(list_of_lists)
+        if headers:
+            headers = fit([headers])[0]
+    if tablefmt == "rst":
+        list_of_lists, headers = _rst_escape_first_column(list_of_lists, headers)
+
+    min_padding, disable_numparse, numalign, stralign = _format_defaults(
+        tablefmt, disable_numparse, numalign, stralign
+    )
+
+    def iter_data_rows(rows, index):
+        """Normalize, index, wrap and escape data rows one at a time."""
+        rows = map(to_list, rows)
+        if index is not None:
+            rows = _iter_row_index(rows, index)
+        for row in rows:
+            if not _is_separating_line(row):
+                if maxcolwidths is not None:
+                    row = _wrap_text_to_colwidths(
+                        [row], maxcolwidths, numparses, wrappers=wrappers
+                    )[0]
+                if colwidths is not None:
+                    row = fit([row])[0]
+                if tablefmt == "rst":
+                    row = _rst_escape_first_column([row], [])[0][0]
+            yield row
+
+    def reread_data_rows():
+        rows = iter(tabular_data)
+        if firstrow:
+            next(rows, None)
+        return iter_data_rows(rows, _stream_index(showindex))
+
+    if two_pass:
+        if keys is None:  # the first pass goes on from the rows read ahead
+            first_rows = sample_rows[1:] if firstrow else sample_rows
+            measured_rows = iter_data_rows(
+                chain(first_rows, rows), _stream_index(showindex)
+            )
+        else:  # the first pass found the keys of the rows
+            measured_rows = reread_data_rows()
+        layout = _layout_scanned(
+            measured_rows,
+            headers,
+            tablefmt,
+            floatfmt,
+            intfmt,
+            numalign,
+            stralign,
+            missingval,
+            disable_numparse,
+            colalign,
+            min_padding,
+            colwidths,
+        )
+        data_rows = _format_row_chunks(reread_data_rows(), layout, known_types=True)
     else:
-        is_multiline = False
-    width_fn = _choose_width_fn(has_invisible, enable_widechars, is_multiline)
+        if may_wrap:  # only wrapped rows after the sample make it multiline
+            next_row = next(rows, _NO_VALUE)
+            may_wrap = next_row is not _NO_VALUE
+            if may_wrap:
+                rows = chain([next_row], rows)
+        layout = _layout_table(
+            list_of_lists,
+            headers,
+            tablefmt,
+            floatfmt,
+            intfmt,
+            numalign,
+            stralign,
+            missingval,
+            disable_numparse,
+            colalign,
+            min_padding,
+            keep_columns=True,
+            colwidths=colwidths,
+            multiline=may_wrap,
+        )
+        sample_rows = layout.rows
+        _reinsert_separating_lines(sample_rows, separating_lines)
+        more_rows = _format_row_chunks(iter_data_rows(rows, index), layout)
+        data_rows = chain(sample_rows, more_rows)
+
+    if rowalign is None or isinstance(rowalign, str):
+        rowaligns = [rowalign]
+    else:  # rows past the end of the list are not aligned
+        rowaligns = list(rowalign) + [None]
+
+    yield from _iter_table_lines(
+        layout.tablefmt,
+        layout.headers,
+        data_rows,
+        layout.colwidths,
+        layout.colaligns,
+        layout.is_multiline,
+        rowaligns,
+    )
+
+
+def _stream_index(showindex):
+    """Return an iterator over row indices for a streamed table, or None."""
+    showindex_is_a_str = type(showindex) in [str, bytes]
+    if isinstance(showindex, Iterable) and not showindex_is_a_str:
+        return iter(showindex)
+    elif showindex == "always" or (_bool(showindex) and not showindex_is_a_str):
+        return count()
+    else:
+        return None
+
+
+def _iter_row_index(rows, index):
+    """Add a left-most index column, taking index values from an iterator."""
+    for row in rows:
+        if _is_separating_line(row):
+            yield row
+            continue
+        index_v = next(index, _NO_VALUE)
+        if index_v is _NO_VALUE:
+            raise ValueError("index is shorter than the number of data rows")
+        yield [index_v] + list(row)
+
+
+def _row_to_list_fn(row, keys):
+    """Return a function converting data rows like `row` to lists of cells.
+
+    This mirrors what _normalize_tabular_data does for a whole table.
+    """
+    if keys is not None:  # dict-like rows
+        return lambda r: [r.get(k) for k in keys]
+    elif dataclasses is not None and dataclasses.is_dataclass(row):
+        field_names = [field.name for field in dataclasses.fields(row)]
+        return lambda r: [getattr(r, f) for f in field_names]
+    else:
+        return lambda r: r if _is_separating_line(r) else list(r)
+
+
+def _expand_maxcolwidths(maxcolwidths, num_cols):
+    """Return a list of `num_cols` maximal column widths (None if unlimited)."""
+    if isinstance(maxcolwidths, int):  # Expand scalar for all columns
+        return _expand_iterable(maxcolwidths, num_cols, maxcolwidths)
+    else:  # Ignore col width for any 'trailing' columns
+        return _expand_iterable(maxcolwidths, num_cols, None)
+
+
+def _format_defaults(tablefmt, disable_numparse, numalign, stralign):
+    """Return min_padding, disable_numparse, numalign and stralign for a format.
+
+    PrettyTable formatting does not use any extra padding.
+    Numbers are not parsed and are treated the same as strings for alignment.
+    Check if pretty is the format being used and override the defaults so it
+    does not impact other formats.
+    """
+    min_padding = MIN_PADDING
+    if tablefmt == "pretty":
+        min_padding = 0
+        disable_numparse = True
+        numalign = "center" if numalign == _DEFAULT_ALIGN else numalign
+        stralign = "center" if stralign == _DEFAULT_ALIGN else stralign
+    else:
+        numalign = "decimal" if numalign == _DEFAULT_ALIGN else numalign
+        stralign = "left" if stralign == _DEFAULT_ALIGN else stralign
+    return min_padding, disable_numparse, numalign, stralign
+
+
+# Result of _layout_table: the formatted and aligned table and the settings
+# which were chosen to lay it out.
+#
+# columns is None unless requested, or a list of _Column tuples which are
+# enough to format additional rows with _format_row.
+_Layout = namedtuple(
+    "_Layout",
+    [
+        "tablefmt",
+        "headers",
+        "rows",
+        "colwidths",
+        "colaligns",
+        "is_multiline",
+        "has_invisible",
+        "enable_widechars",
+        "columns",
+    ],
+)
+
+_Column = namedtuple(
+    "_Column",
+    ["type", "floatfmt", "intfmt", "missingval", "numparse", "align", "width", "decimals"],
+)
+
+
+def _layout_table(
+    list_of_lists,
+    headers,
+    tablefmt,
+    floatfmt,
+    intfmt,
+    numalign,
+    stralign,
+    missingval,
+    disable_numparse,
+    colalign,
+    min_padding,
+    keep_columns=False,
+    known_types=None,
+    executor=None,
+    colwidths=None,
+    multiline=False,
+):
+    """Format and align the cells and headers of a normalized table.
+
+    Separating lines should be already removed from `list_of_lists`.
+    Return a _Layout; its `columns` are filled in only if `keep_columns`.
 
-    # format rows and columns, convert numeric values to strings
+    `known_types` are the column types from `_dtype_column_types`. The
+    values of such columns are numbers, so they are formatted without
+    inspecting every value, and their widths are their lengths.
+
+    If an `executor` is given, the columns are formatted and aligned by
+    `_layout_column` in its workers, one column per task.
+
+    `colwidths` are the fixed widths of the columns, None for the columns
+    which are as wide as their widest cell. Cells of fixed width columns
+    are padded without being measured.
+
+    If `multiline`, the table is laid out with multiline rows, if its
+    format has them, even if none of its cells has several lines.
+    """
     cols = list(izip_longest(*list_of_lists))
-    numparses = _expand_numparse(disable_numparse, len(cols))
-    coltypes = [_column_type(col, numparse=np) for col, np in zip(cols, numparses)]
+    colaligns = [_ALIGN_BY_TYPE] * len(cols)
+    if colalign is not None:
+        assert isinstance(colalign, Iterable)
+        for idx, align in enumerate(colalign):
+            colaligns[idx] = align
+    # a table without columns has no columns to disable number parsing in
+    numparses = _expand_numparse(disable_numparse, len(cols)) if cols else []
     if isinstance(floatfmt, str):  # old version
         float_formats = len(cols) * [
             floatfmt
@@ -2141,6 +3439,45 @@ def tabulate(
         float_formats = list(floatfmt)
         if len(float_formats) < len(cols):
             float_formats.extend((len(cols) - len(float_formats)) * [_DEFAULT_FLOATFMT])
+    # formatted numbers are plain ASCII unless the format has a fancy fill char
+    known = [
+        known_type is not None and numparse and fl_fmt.isascii()
+        for known_type, numparse, fl_fmt in zip(
+            known_types or repeat(None), numparses, float_formats
+        )
+    ]
+
+    # optimization: look for ANSI control codes column by column,
+    # enable smart width functions only in the columns where one is found
+    #
+    # bytestrings are decoded safely (i.e. errors ignored); the values of
+    # known numeric columns are not inspected, only their headers
+    col_headers = list(headers) + [""] * (len(cols) - len(headers))
+
+    def column_strings(i):
+        if known[i]:
+            return [col_headers[i]]
+        return chain([col_headers[i]], map(_to_str, cols[i]))
+
+    invisibles = [_has_invisible_codes(column_strings(i)) for i in range(len(cols))]
+    has_invisible = any(invisibles) or _has_invisible_codes(headers)
+
+    enable_widechars = wcwidth is not None and WIDE_CHARS_MODE
+    if (
+        not isinstance(tablefmt, TableFormat)
+        and tablefmt in multiline_formats
+        and (
+            multiline
+            or any(map(_is_multiline, headers))
+            or any(any(map(_is_multiline, column_strings(i))) for i in range(len(cols)))
+        )
+    ):
+        tablefmt = multiline_formats.get(tablefmt, tablefmt)
+        is_multiline = True
+    else:
+        is_multiline = False
+    width_fn = _choose_width_fn(has_invisible, enable_widechars, is_multiline)
+
     if isinstance(intfmt, str):  # old version
         int_formats = len(cols) * [
             intfmt
@@ -2155,53 +3492,618 @@ def tabulate(
         missing_vals = list(missingval)
         if len(missing_vals) < len(cols):
             missing_vals.extend((len(cols) - len(missing_vals)) * [_DEFAULT_MISSINGVAL])
-    cols = [
-        [_format(v, ct, fl_fmt, int_fmt, miss_v, has_invisible) for v in c]
-        for c, ct, fl_fmt, int_fmt, miss_v in zip(
-            cols, coltypes, float_formats, int_formats, missing_vals
-        )
-    ]
-
-    # align columns
-    aligns = [numalign if ct in [int, float] else stralign for ct in coltypes]
-    if colalign is not None:
-        assert isinstance(colalign, Iterable)
-        for idx, align in enumerate(colalign):
-            aligns[idx] = align
-    minwidths = (
-        [width_fn(h) + min_padding for h in headers] if headers else [0] * len(cols)
+    fixed_widths = list(colwidths or [])
+    fixed_widths.extend([None] * (max(len(cols), len(headers)) - len(fixed_widths)))
+
+    # format and align the columns, one by one or in the worker processes
+    settings = zip(
+        cols,
+        col_headers if headers else repeat(None),
+        [kt if k else None for kt, k in zip(known_types or repeat(None), known)],
+        numparses,
+        float_formats,
+        int_formats,
+        missing_vals,
+        colaligns,
+        repeat(numalign),
+        repeat(stralign),
+        repeat(has_invisible),
+        invisibles,
+        repeat(enable_widechars),
+        repeat(is_multiline),
+        repeat(min_padding),
+        fixed_widths,
+        repeat(PRESERVE_WHITESPACE),
     )
-    cols = [
-        _align_column(c, a, minw, has_invisible, enable_widechars, is_multiline)
-        for c, a, minw in zip(cols, aligns, minwidths)
+    if executor is None:
+        laid_out = [_layout_column(*s) for s in settings]
+    else:
+        laid_out = list(executor.map(_layout_column, *zip(*settings)))
+    coltypes, aligns, cols, minwidths, widechars, decimals = (
+        map(list, zip(*laid_out)) if laid_out else ([] for _ in range(6))
+    )
+    if headers and len(cols) > len(headers):
+        # cells beyond the headers are dropped, but the alignments of their
+        # columns are kept, as tabulate() has always done (in latex specs)
+        del coltypes[len(headers) :], cols[len(headers) :]
+        del minwidths[len(headers) :], widechars[len(headers) :]
+        del decimals[len(headers) :]
+    width_fns = [
+        _choose_width_fn(inv, wide, is_multiline)
+        for inv, wide in zip(invisibles, widechars)
     ]
 
     if headers:
         # align headers and add headers
         t_cols = cols or [[""]] * len(headers)
         t_aligns = aligns or [stralign] * len(headers)
-        minwidths = [
-            max(minw, max(width_fn(cl) for cl in c))
-            for minw, c in zip(minwidths, t_cols)
-        ]
+        t_width_fns = list(chain(width_fns, repeat(width_fn, len(t_cols))))
+        if not cols:
+            minwidths = [
+                fn(h) + min_padding if fixed is None else fixed
+                for h, fn, fixed in zip(headers, t_width_fns, fixed_widths)
+            ]
         headers = [
-            _align_header(h, a, minw, width_fn(h), is_multiline, width_fn)
-            for h, a, minw in zip(headers, t_aligns, minwidths)
+            _align_header(h, a, minw, fn(h), is_multiline, fn)
+            for h, a, minw, fn in zip(headers, t_aligns, minwidths, t_width_fns)
         ]
-        rows = list(zip(*cols))
-    else:
-        minwidths = [max(width_fn(cl) for cl in c) for c in cols]
-        rows = list(zip(*cols))
+    rows = list(zip(*cols))
 
     if not isinstance(tablefmt, TableFormat):
         tablefmt = _table_formats.get(tablefmt, _table_formats["simple"])
 
-    ra_default = rowalign if isinstance(rowalign, str) else None
-    rowaligns = _expand_iterable(rowalign, len(rows), ra_default)
-    _reinsert_separating_lines(rows, separating_lines)
+    columns = None
+    if keep_columns:
+        columns = [
+            _Column(*column)
+            for column in zip(
+                coltypes,
+                float_formats,
+                int_formats,
+                missing_vals,
+                numparses,
+                aligns,
+                minwidths,
+                decimals,
+            )
+        ]
 
-    return _format_table(
-        tablefmt, headers, rows, minwidths, aligns, is_multiline, rowaligns=rowaligns
+    return _Layout(
+        tablefmt,
+        headers,
+        rows,
+        minwidths,
+        aligns,
+        is_multiline,
+        has_invisible,
+        enable_widechars,
+        columns,
+    )
+
+
+def _layout_column(
+    col,
+    header,
+    known_type,
+    numparse,
+    floatfmt,
+    intfmt,
+    missingval,
+    colalign,
+    numalign,
+    stralign,
+    has_invisible,
+    is_invisible,
+    enable_widechars,
+    is_multiline,
+    min_padding,
+    fixed_width=None,
+    preserve_whitespace=None,
+):
+    """Format and align one column of a table for `_layout_table`.
+
+    `header` is None if the table has no headers, `known_type` is None
+    unless the values are numbers of this type, and `colalign` is
+    _ALIGN_BY_TYPE to align the column by its type. `has_invisible` tells if any column
+    of the table has ANSI codes, `is_invisible` if this one does.
+    `fixed_width` is the width of the column, if it is not to be measured.
+    `preserve_whitespace` and `enable_widechars` are the module settings
+    of the caller, which worker processes may not share.
+
+    Return the column type, its alignment, the aligned cells, the column
+    width, whether the column has wide characters, and the largest number
+    of digits after the point (None unless the column is decimal aligned).
+
+    """
+    if known_type is not None:
+        coltype = known_type
+        analysis = None
+        col = [format(float(v), floatfmt) for v in col]
+    else:
+        analysis = _ColumnAnalysis(col, is_invisible, numparse)
+        coltype = analysis.type
+        col = list(
+            map(
+                _memoize_column(
+                    partial(
+                        _format,
+                        valtype=coltype,
+                        floatfmt=floatfmt,
+                        intfmt=intfmt,
+                        missingval=missingval,
+                        has_invisible=has_invisible,
+                    )
+                ),
+                col,
+            )
+        )
+
+    # wide characters are measured only in the columns which have other
+    # characters than printable ASCII once formatted
+    strings = col if header is None else chain([header], col)
+    is_wide = enable_widechars and not all(map(_is_printable_ascii, strings))
+    width_fn = _choose_width_fn(
+        is_invisible, is_wide, is_multiline, use_wcwidth=enable_widechars
+    )
+
+    if colalign is not _ALIGN_BY_TYPE:
+        align = colalign
+    else:
+        align = numalign if coltype in [int, float] else stralign
+    if fixed_width is not None:
+        minwidth = fixed_width
+    elif header is None:
+        minwidth = 0
+    else:
+        minwidth = width_fn(header) + min_padding
+    is_fixed = fixed_width is not None
+    if align != "decimal":
+        decimals = None
+    elif analysis is None:
+        decimals = [_afterpoint(s) for s in col]
+    else:
+        decimals = analysis.afterpoints(col, intfmt, missingval, has_invisible)
+
+    if analysis is None:
+        col = _align_column(
+            col,
+            align,
+            minwidth,
+            False,
+            False,
+            False,
+            decimals=decimals,
+            fixed_width=is_fixed,
+            preserve_whitespace=preserve_whitespace,
+        )
+        widths = map(len, col)
+    else:
+        col = _align_column(
+            col,
+            align,
+            minwidth,
+            is_invisible,
+            is_wide,
+            is_multiline,
+            decimals=decimals,
+            fixed_width=is_fixed,
+            preserve_whitespace=preserve_whitespace,
+            use_wcwidth=enable_widechars,
+        )
+        widths = map(_memoize_column(width_fn), col)
+    if is_fixed:
+        width = fixed_width
+    elif header is None:
+        width = max(widths)
+    else:
+        width = max(minwidth, max(widths))
+    maxdecimals = None if decimals is None else max(decimals)
+    return coltype, align, col, width, is_wide, maxdecimals
+
+
+def _format_cell(val, column, has_invisible, known_type=False):
+    """Format a value of a column laid out before.
+
+    Unless the column type is known to cover the value, a value which is
+    more generic than its column is formatted according to its own type.
+    """
+    if known_type or column.type is str:  # no value is more generic than str
+        valtype = column.type
+    elif column.numparse and column.type in (int, float) and type(val) in (int, float):
+        valtype = float if float in (column.type, type(val)) else int
+    else:
+        valtype = _more_generic(column.type, _type(val, numparse=column.numparse))
+    has_invisible = has_invisible or (isinstance(val, str) and "\x1b" in val)
+    return _format(
+        val, valtype, column.floatfmt, column.intfmt, column.missingval, has_invisible
+    )
+
+
+def _format_row(row, layout, known_types=False):
+    """Format and align one more data row to fit a table laid out before.
+
+    Unless the column types are known to cover all values, cells which are
+    more generic than their column are formatted according to their own
+    type. Missing cells are treated as None.
+    """
+    if _is_separating_line(row):
+        return row
+    cells = []
+    for val, col in zip(chain(row, repeat(None)), layout.columns):
+        s = _format_cell(val, col, layout.has_invisible, known_types)
+        cells.extend(
+            _align_column(
+                [s],
+                col.align,
+                max(col.width, 0),  # widths are -1 if wcswidth fails
+                layout.has_invisible or "\x1b" in s,
+                layout.enable_widechars,
+                layout.is_multiline,
+                maxdecimals=col.decimals,
+                # a single line cell can be padded without being measured
+                fixed_width=not layout.is_multiline,
+            )
+        )
+    return cells
+
+
+def _format_rows(rows, layout, known_types=False):
+    """Format and align data rows to fit a table laid out before.
+
+    Like _format_row, but a column at a time: the values are formatted
+    once per distinct value, and cells of plain text are padded to the
+    width of their column without being measured. Separating lines should
+    be already removed from `rows`.
+    """
+    cols = list(izip_longest(*rows))
+    missing = [None] * len(rows)
+    aligned = []
+    for values, col in zip(chain(cols, repeat(missing)), layout.columns):
+        format_cell = _memoize_column(
+            partial(
+                _format_cell,
+                column=col,
+                has_invisible=layout.has_invisible,
+                known_type=known_types,
+            )
+        )
+        strings = list(map(format_cell, values))
+        aligned.append(
+            _align_column(
+                strings,
+                col.align,
+                max(col.width, 0),  # widths are -1 if wcswidth fails
+                layout.has_invisible or _has_invisible_codes(strings),
+                layout.enable_widechars,
+                layout.is_multiline,
+                maxdecimals=col.decimals,
+                fixed_width=True,
+            )
+        )
+    return list(zip(*aligned))
+
+
+def _format_row_chunks(rows, layout, known_types=False, size=64):
+    """Format and align data rows to fit a table laid out before, one by one.
+
+    Rows are read `size` at a time and formatted with _format_rows, which
+    is much faster than _format_row for every row and still keeps only a
+    few rows in memory. Separating lines are passed through.
+
+    Multiline cells too wide for their column are padded to their own width
+    by _format_row, so tables with multiline cells are formatted row by row.
+    """
+    if layout.is_multiline:
+        yield from (_format_row(row, layout, known_types) for row in rows)
+        return
+    chunk = []
+    for row in rows:
+        if _is_separating_line(row):
+            if chunk:
+                yield from _format_rows(chunk, layout, known_types)
+                chunk = []
+            yield row
+        else:
+            chunk.append(row)
+            if len(chunk) >= size:
+                yield from _format_rows(chunk, layout, known_types)
+                chunk = []
+    if chunk:
+        yield from _format_rows(chunk, layout, known_types)
+
+
+# Column types in the order of increasing generality, as in _more_generic,
+# starting with the type of a column without values
+_generic_types = [bool, int, float, bytes, str]
+
+
+class _ColumnScan:
+    """Infer the type and the width of a table column one value at a time.
+
+    Only the least generic type of the values seen so far is kept, and,
+    for every type the column may yet generalize to, how wide the values
+    would be once formatted and aligned as values of that type. The result
+    is the same as _layout_table's, without holding the column in memory.
+    """
+
+    def __init__(
+        self, numparse, floatfmt, intfmt, missingval, aligns, multiline_fmt
+    ):
+        self.type = bool
+        self.numparse = numparse
+        self.floatfmt = floatfmt
+        self.intfmt = intfmt
+        self.missingval = missingval
+        self.aligns = aligns  # column alignment for every possible type
+        self.has_invisible = False
+        self.is_multiline = False
+        self._has_none = False
+        enable_widechars = wcwidth is not None and WIDE_CHARS_MODE
+        self._width_fns = {
+            has_invisible: _align_column_choose_width_fn(
+                has_invisible, enable_widechars, multiline_fmt
+            )
+            for has_invisible in (False, True)
+        }
+        self._multiline_fmt = multiline_fmt
+        # for every possible column type: the widest cell line which is not
+        # moved by decimal alignment, the widest last line of a cell less its
+        # digits after the point, the most digits after the point, and
+        # whether any cell line has a known width (wcswidth may return -1)
+        self._widths = {t: [None, None, -1, False] for t in _generic_types}
+        # errors formatting values as a type the column is not (yet)
+        self._errors = {}
+
+    def add(self, val):
+        "Account for one more value in the column."
+        if val is None:
+            if self._has_none:  # no new information
+                return
+            self._has_none = True
+        elif isinstance(val, (str, bytes)):
+            s = _to_str(val)
+            if not self.has_invisible and "\x1b" in s:
+                self.has_invisible = _ansi_codes.search(s) is not None
+            if not self.is_multiline:
+                self.is_multiline = _is_multiline(s)
+
+        self.type = _more_generic(self.type, _type(val, numparse=self.numparse))
+        for t in _generic_types[: _generic_types.index(self.type)]:
+            self._widths.pop(t, None)
+
+        has_invisible = isinstance(val, str) and "\x1b" in val
+        formatted = {}
+        for t, widths in self._widths.items():
+            # bool, bytes and str columns all format non-bytes values with str()
+            fmt_type = str if t is bool or (t is bytes and type(val) is not bytes) else t
+            if t in self._errors:
+                continue
+            if fmt_type not in formatted:
+                try:
+                    formatted[fmt_type] = _format(
+                        val,
+                        fmt_type,
+                        self.floatfmt,
+                        self.intfmt,
+                        self.missingval,
+                        has_invisible,
+                    )
+                except (ValueError, TypeError) as e:
+                    # e.g. "False" as a float, fails if the column becomes float
+                    formatted[fmt_type] = e
+            if isinstance(formatted[fmt_type], Exception):
+                self._errors[t] = formatted[fmt_type]
+            else:
+                self._measure(formatted[fmt_type], self.aligns[t], widths)
+
+    def _measure(self, s, alignment, widths):
+        has_invisible = "\x1b" in s
+        if alignment == "decimal":
+            decimals = _afterpoint(_strip_ansi(s) if has_invisible else s)
+        elif alignment and not PRESERVE_WHITESPACE:
+            s = s.strip()
+        line_widths = self._width_fns[has_invisible](s)
+        if not self._multiline_fmt:
+            line_widths = [line_widths]
+        fixed = line_widths[:-1]
+        last = line_widths[-1]
+        if alignment == "decimal" and last >= 0:
+            # decimal alignment pads the last line of a cell on the right
+            last -= decimals
+            widths[1] = last if widths[1] is None else max(widths[1], last)
+            widths[2] = max(widths[2], decimals)
+        else:
+            fixed.append(last)
+        if fixed:
+            top = max(fixed)
+            widths[0] = top if widths[0] is None else max(widths[0], top)
+        widths[3] = widths[3] or max(line_widths) >= 0
+
+    def column(self, minwidth=None):
+        """Return _Column settings to fit all values seen so far.
+
+        `minwidth` is the minimal width required by the header, if any.
+        """
+        if self.type in self._errors:
+            raise self._errors[self.type]
+        top, padded, decimals, has_width = self._widths[self.type]
+        alignment = self.aligns[self.type]
+        if not alignment:  # cells are not padded
+            width = top
+        elif has_width:
+            candidates = [top, minwidth or 0]
+            if padded is not None:
+                candidates.append(padded + decimals)
+            width = max(w for w in candidates if w is not None)
+        else:
+            width = -1
+        if minwidth is not None:
+            width = max(width, minwidth)
+        return _Column(
+            self.type,
+            self.floatfmt,
+            self.intfmt,
+            self.missingval,
+            self.numparse,
+            alignment,
+            width,
+            decimals if alignment == "decimal" else None,
+        )
+
+
+def _layout_scanned(
+    rows,
+    headers,
+    tablefmt,
+    floatfmt,
+    intfmt,
+    numalign,
+    stralign,
+    missingval,
+    disable_numparse,
+    colalign,
+    min_padding,
+    colwidths=None,
+):
+    """Lay out a table like _layout_table, reading its rows only once.
+
+    `rows` can be any iterable of normalized rows. Only a _ColumnScan per
+    column is kept in memory, so the layout has no `rows`, and `columns`
+    are used to format the rows with _format_rows when they are read again.
+    """
+    scans = []
+    nrows = _scan_rows(
+        scans,
+        rows,
+        0,
+        tablefmt,
+        floatfmt,
+        intfmt,
+        numalign,
+        stralign,
+        missingval,
+        disable_numparse,
+        colalign,
+    )
+    if not nrows:
+        return _layout_table(
+            [],
+            headers,
+            tablefmt,
+            floatfmt,
+            intfmt,
+            numalign,
+            stralign,
+            missingval,
+            disable_numparse,
+            colalign,
+            min_padding,
+            keep_columns=True,
+            colwidths=colwidths,
+        )
+    return _layout_scans(scans, headers, tablefmt, min_padding, colwidths)
+
+
+def _scan_rows(
+    scans,
+    rows,
+    nrows,
+    tablefmt,
+    floatfmt,
+    intfmt,
+    numalign,
+    stralign,
+    missingval,
+    disable_numparse,
+    colalign,
+):
+    """Account for more rows in the _ColumnScans of a table.
+
+    `nrows` rows were scanned before. New columns get a scan, as if they
+    were missing in the rows before. Return the number of scanned rows.
+    """
+    multiline_fmt = (
+        not isinstance(tablefmt, TableFormat) and tablefmt in multiline_formats
+    )
+    for row in rows:
+        if _is_separating_line(row):
+            continue
+        for i in range(len(scans), len(row)):
+            if isinstance(floatfmt, str):
+                fl_fmt = floatfmt
+            else:
+                fl_fmt = floatfmt[i] if i < len(floatfmt) else _DEFAULT_FLOATFMT
+            if isinstance(intfmt, str):
+                int_fmt = intfmt
+            else:
+                int_fmt = intfmt[i] if i < len(intfmt) else _DEFAULT_INTFMT
+            if isinstance(missingval, str):
+                miss_v = missingval
+            else:
+                miss_v = missingval[i] if i < len(missingval) else _DEFAULT_MISSINGVAL
+            if isinstance(disable_numparse, Iterable):
+                numparse = i not in disable_numparse
+            else:
+                numparse = not disable_numparse
+            aligns = {t: numalign if t in [int, float] else stralign for t in _generic_types}
+            if colalign is not None and i < len(colalign):
+                aligns = dict.fromkeys(_generic_types, colalign[i])
+            scan = _ColumnScan(numparse, fl_fmt, int_fmt, miss_v, aligns, multiline_fmt)
+            if nrows:  # the column is missing in the rows before
+                scan.add(None)
+            scans.append(scan)
+        for val, scan in zip(chain(row, repeat(None)), scans):
+            scan.add(val)
+        nrows += 1
+    return nrows
+
+
+def _layout_scans(scans, headers, tablefmt, min_padding, colwidths=None):
+    """Return a _Layout without `rows` to fit the values seen by `scans`."""
+    multiline_fmt = (
+        not isinstance(tablefmt, TableFormat) and tablefmt in multiline_formats
+    )
+    has_invisible = any(scan.has_invisible for scan in scans) or any(
+        _ansi_codes.search(h) for h in headers
+    )
+    enable_widechars = wcwidth is not None and WIDE_CHARS_MODE
+    is_multiline = multiline_fmt and (
+        any(scan.is_multiline for scan in scans) or any(map(_is_multiline, headers))
+    )
+    if is_multiline:
+        tablefmt = multiline_formats.get(tablefmt, tablefmt)
+    width_fn = _choose_width_fn(has_invisible, enable_widechars, is_multiline)
+
+    aligns = [scan.aligns[scan.type] for scan in scans]
+    if headers:
+        minwidths = [width_fn(h) + min_padding for h in headers]
+        columns = [scan.column(minw) for scan, minw in zip(scans, minwidths)]
+    else:
+        columns = [scan.column() for scan in scans]
+    if colwidths is not None:
+        columns = [
+            col if fixed is None else col._replace(width=fixed)
+            for col, fixed in zip(columns, chain(colwidths, repeat(None)))
+        ]
+    if headers:
+        headers = [
+            _align_header(h, col.align, col.width, width_fn(h), is_multiline, width_fn)
+            for h, col in zip(headers, columns)
+        ]
+
+    if not isinstance(tablefmt, TableFormat):
+        tablefmt = _table_formats.get(tablefmt, _table_formats["simple"])
+
+    return _Layout(
+        tablefmt,
+        headers,
+        None,
+        [col.width for col in columns],
+        aligns,
+        is_multiline,
+        has_invisible,
+        enable_widechars,
+        columns,
     )
 
 
@@ -2261,6 +4163,36 @@ def _build_row(padded_cells, colwidths, colaligns, rowfmt):
         return _build_simple_row(padded_cells, rowfmt)
 
 
+def _compile_row(rowfmt, colwidths, colaligns, pad):
+    """Return a function which pads the aligned cells of a row and builds
+    the row, like _pad_row and _build_row.
+
+    The padding is joined with the begin, separator and end of a DataRow
+    once, so that every row takes a single join.
+
+    >>> build_row = _compile_row(DataRow("|", "|", "|"), [3, 5], ["left"] * 2, 1)
+    >>> build_row(["a", "bcd"])
+    '| a | bcd |'
+
+    """
+    if not rowfmt:
+        return lambda cells: None
+    if hasattr(rowfmt, "__call__"):
+        return lambda cells: rowfmt(_pad_row(cells, pad), colwidths, colaligns)
+    begin, sep, end = rowfmt
+    padding = " " * pad
+    head = begin + padding
+    joint = padding + sep + padding
+    tail = padding + end
+
+    def build_row(cells):
+        if not cells:
+            return (begin + end).rstrip()
+        return (head + joint.join(cells) + tail).rstrip()
+
+    return build_row
+
+
 def _append_basic_row(lines, padded_cells, colwidths, colaligns, rowfmt, rowalign=None):
     # NOTE: rowalign is ignored and exists for api compatibility with _append_multiline_row
     lines.append(_build_row(padded_cells, colwidths, colaligns, rowfmt))
@@ -2284,22 +4216,35 @@ def _append_multiline_row(
     lines, padded_multiline_cells, padded_widths, colaligns, rowfmt, pad, rowalign=None
 ):
     colwidths = [w - 2 * pad for w in padded_widths]
-    cells_lines = [c.splitlines() for c in padded_multiline_cells]
-    nlines = max(map(len, cells_lines))  # number of lines in the row
-    # vertically pad cells where some lines are missing
-    # cells_lines = [
-    #     (cl + [" " * w] * (nlines - len(cl))) for cl, w in zip(cells_lines, colwidths)
-    # ]
+    build_line = _compile_row(rowfmt, colwidths, colaligns, pad)
+    lines.extend(
+        _multiline_row_lines(padded_multiline_cells, colwidths, build_line, rowalign)
+    )
+    return lines
+
+
+def _multiline_row_lines(cells, colwidths, build_line, rowalign=None):
+    """Return the lines of a row of aligned multiline cells.
 
+    `build_line` builds one line of the row from a line of every cell, see
+    _compile_row. A row whose cells all have exactly one line, as most
+    rows of most multiline tables do, is built without being split.
+    """
+    if (
+        len(cells) == len(colwidths)
+        and all(cells)
+        and not _line_boundaries.search("".join(cells))
+    ):
+        return [build_line(cells)]
+    cells_lines = [c.splitlines() for c in cells]
+    # number of lines in the row, a row of empty cells has a blank line
+    nlines = max(max(map(len, cells_lines)), 1)
+    # vertically pad cells where some lines are missing
     cells_lines = [
         _align_cell_veritically(cl, nlines, w, rowalign)
         for cl, w in zip(cells_lines, colwidths)
     ]
-    lines_cells = [[cl[i] for cl in cells_lines] for i in range(nlines)]
-    for ln in lines_cells:
-        padded_ln = _pad_row(ln, pad)
-        _append_basic_row(lines, padded_ln, colwidths, colaligns, rowfmt)
-    return lines
+    return [build_line(ln) for ln in zip(*cells_lines)]
 
 
 def _build_line(colwidths, colaligns, linefmt):
@@ -2332,8 +4277,109 @@ class JupyterHTMLStr(str):
         return self
 
 
-def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowaligns):
-    """Produce a plain-text representation of the table."""
+def _format_table(
+    fmt,
+    headers,
+    rows,
+    colwidths,
+    colaligns,
+    is_multiline,
+    rowaligns,
+    executor=None,
+    file=None,
+):
+    """Produce a plain-text representation of the table.
+
+    If an `executor` is given, blocks of ROW_BLOCK_SIZE rows are turned
+    into lines by `_format_row_block` in its workers.
+
+    If a `file` is given, the table is written to it instead, see
+    `_write_lines`, and the number of characters written is returned.
+    """
+    if file is not None:
+        if not (headers or rows):
+            file.write("\n")
+            return 1
+        lines = _iter_table_lines(
+            fmt, headers, rows, colwidths, colaligns, is_multiline, rowaligns, executor
+        )
+        return _write_lines(lines, file)
+    if headers or rows:
+        output = "\n".join(
+            _iter_table_lines(
+                fmt,
+                headers,
+                rows,
+                colwidths,
+                colaligns,
+                is_multiline,
+                rowaligns,
+                executor,
+            )
+        )
+        if fmt.lineabove == _html_begin_table_without_header:
+            return JupyterHTMLStr(output)
+        else:
+            return output
+    else:  # a completely empty table
+        return ""
+
+
+def _write_lines(lines, file):
+    """Write `lines` to a text `file`, each followed by a newline.
+
+    Lines are joined into chunks of about WRITE_BUFFER_SIZE characters,
+    so that a long table takes few writes and is never held in memory
+    whole. Return the number of characters written.
+
+    >>> import io
+    >>> f = io.StringIO()
+    >>> _write_lines(["spam", "eggs"], f), f.getvalue()
+    (10, 'spam\\neggs\\n')
+
+    """
+    written = 0
+    chunk = []
+    size = 0
+    for line in lines:
+        chunk.append(line)
+        size += len(line) + 1
+        if size >= WRITE_BUFFER_SIZE:
+            chunk.append("")
+            file.write("\n".join(chunk))
+            written += size
+            chunk = []
+            size = 0
+    if chunk:
+        chunk.append("")
+        file.write("\n".join(chunk))
+        written += size
+    return written
+
+
+def _iter_table_lines(
+    fmt, headers, rows, colwidths, colaligns, is_multiline, rowaligns, executor=None
+):
+    """Yield the lines of a plain-text representation of the table.
+
+    `rows` may be any iterable of aligned rows, it is consumed one row at a
+    time. Data rows past the end of `rowaligns` use its last alignment.
+
+    If an `executor` is given and `rows` is a list of more than
+    ROW_BLOCK_SIZE rows, the lines of every block of rows are yielded
+    joined together.
+    """
+    if isinstance(rows, list):
+        fmt, rows = _escape_html_columns(fmt, rows)
+    if executor is not None and isinstance(rows, list) and len(rows) > ROW_BLOCK_SIZE:
+        blocks = _row_blocks(rows, rowaligns)
+    else:
+        blocks = None
+    rows = iter(rows)
+    first_row = next(rows, _NO_VALUE)
+    if not headers and first_row is _NO_VALUE:  # a completely empty table
+        return
+
     lines = []
     hidden = fmt.with_header_hide if (headers and fmt.with_header_hide) else []
     pad = fmt.padding
@@ -2348,7 +4394,6 @@ def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowali
         append_row = _append_basic_row
 
     padded_headers = pad_row(headers, pad)
-    padded_rows = [pad_row(row, pad) for row in rows]
 
     if fmt.lineabove and "lineabove" not in hidden:
         _append_line(lines, padded_widths, colaligns, fmt.lineabove)
@@ -2358,49 +4403,128 @@ def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowali
         if fmt.linebelowheader and "linebelowheader" not in hidden:
             _append_line(lines, padded_widths, colaligns, fmt.linebelowheader)
 
-    if padded_rows and fmt.linebetweenrows and "linebetweenrows" not in hidden:
-        # initial rows with a line below
-        for row, ralign in zip(padded_rows[:-1], rowaligns):
-            append_row(
-                lines, row, padded_widths, colaligns, fmt.datarow, rowalign=ralign
-            )
-            _append_line(lines, padded_widths, colaligns, fmt.linebetweenrows)
-        # the last row without a line below
-        append_row(
-            lines,
-            padded_rows[-1],
+    yield from lines
+
+    if blocks is not None:
+        block_lines = executor.map(
+            _format_row_block,
+            repeat(fmt),
+            blocks,
+            repeat(padded_widths),
+            repeat(colaligns),
+            repeat(is_multiline),
+            repeat(hidden),
+        )
+        yield from block_lines
+    elif first_row is not _NO_VALUE:
+        yield from _iter_row_lines(
+            fmt,
+            chain([first_row], rows),
             padded_widths,
             colaligns,
-            fmt.datarow,
-            rowalign=rowaligns[-1],
+            is_multiline,
+            rowaligns,
+            hidden,
         )
+
+    if fmt.linebelow and "linebelow" not in hidden:
+        yield _build_line(padded_widths, colaligns, fmt.linebelow)
+
+
+def _iter_row_lines(
+    fmt, rows, padded_widths, colaligns, is_multiline, rowaligns, hidden, first=True
+):
+    """Yield the lines of the data rows of a table.
+
+    `first` tells if the rows start at the first data row of the table,
+    which has no line between rows above it.
+
+    The horizontal lines, and the parts of single-line rows which do not
+    depend on the cells, are built once for all the rows.
+    """
+    pad = fmt.padding
+    if is_multiline:
+        colwidths = [w - 2 * pad for w in padded_widths]
+        build_line = _compile_row(fmt.datarow, colwidths, colaligns, pad)
+
+        def multiline_row(row, rowalign=None):
+            return _multiline_row_lines(row, colwidths, build_line, rowalign)
+
+    else:
+        build_row = _compile_row(fmt.datarow, padded_widths, colaligns, pad)
+
+    if fmt.linebetweenrows and "linebetweenrows" not in hidden:
+        # all rows but the first with a line above
+        line_between = _build_line(padded_widths, colaligns, fmt.linebetweenrows)
+        last_ralign = len(rowaligns) - 1
+        for i, row in enumerate(rows):
+            if i or not first:
+                yield line_between
+            if is_multiline:
+                ralign = rowaligns[min(i, last_ralign)] if rowaligns else None
+                yield from multiline_row(row, ralign)
+            else:
+                yield build_row(row)
     else:
-        separating_line = (
+        separating_line = _build_line(
+            padded_widths,
+            colaligns,
             fmt.linebetweenrows
             or fmt.linebelowheader
             or fmt.linebelow
             or fmt.lineabove
-            or Line("", "", "", "")
+            or Line("", "", "", ""),
         )
-        for row in padded_rows:
+        if not is_multiline and pad:
+            # separating lines are tested for after padding, and a padded
+            # cell is never SEPARATING_LINE
+            yield from map(build_row, rows)
+            return
+        for row in rows:
             # test to see if either the 1st column or the 2nd column (account for showindex) has
             # the SEPARATING_LINE flag
             if _is_separating_line(row):
-                _append_line(lines, padded_widths, colaligns, separating_line)
+                yield separating_line
+            elif is_multiline:
+                yield from multiline_row(row)
             else:
-                append_row(lines, row, padded_widths, colaligns, fmt.datarow)
+                yield build_row(row)
 
-    if fmt.linebelow and "linebelow" not in hidden:
-        _append_line(lines, padded_widths, colaligns, fmt.linebelow)
 
-    if headers or rows:
-        output = "\n".join(lines)
-        if fmt.lineabove == _html_begin_table_without_header:
-            return JupyterHTMLStr(output)
+# A block of data rows of a table, their alignments, and whether the block
+# starts at the first data row.
+_RowBlock = namedtuple("_RowBlock", ["rows", "rowaligns", "first"])
+
+
+def _row_blocks(rows, rowaligns):
+    """Split the data rows of a table into _RowBlocks of ROW_BLOCK_SIZE rows."""
+    last_ralign = len(rowaligns) - 1
+    for i in range(0, len(rows), ROW_BLOCK_SIZE):
+        block = rows[i : i + ROW_BLOCK_SIZE]
+        if rowaligns:
+            block_rowaligns = [
+                rowaligns[min(j, last_ralign)] for j in range(i, i + len(block))
+            ]
         else:
-            return output
-    else:  # a completely empty table
-        return ""
+            block_rowaligns = rowaligns
+        yield _RowBlock(block, block_rowaligns, i == 0)
+
+
+def _format_row_block(fmt, block, padded_widths, colaligns, is_multiline, hidden):
+    """Return the lines of a _RowBlock joined together."""
+    lines = list(
+        _iter_row_lines(
+            fmt,
+            block.rows,
+            padded_widths,
+            colaligns,
+            is_multiline,
+            block.rowaligns,
+            hidden,
+            block.first,
+        )
+    )
+    return "\n".join(lines)
 
 
 class _CustomTextWrap(textwrap.TextWrapper):
@@ -2419,12 +4543,91 @@ class _CustomTextWrap(textwrap.TextWrapper):
     @staticmethod
     def _len(item):
         """Custom len that gets console column width for wide
-        and non-wide characters as well as ignores color codes"""
-        stripped = _strip_ansi(item)
-        if wcwidth:
-            return wcwidth.wcswidth(stripped)
-        else:
-            return len(stripped)
+        and non-wide characters as well as ignores color codes.
+
+        The widths are not kept in _width_cache: the words and lines of a
+        wrapped text are seldom measured again, and would only push the
+        widths of cells out of the cache.
+        """
+        if _is_printable_ascii(item):
+            return len(item)
+        return _string_width(item, True, bool(wcwidth))
+
+    def _break_long_word(self, word, space_left, width):
+        """Break a long word into a start which fits into `space_left`, and
+        pieces which fit into lines of `width`, in one pass over the word.
+
+        A character wider than `width` is put on a line of its own.
+        """
+        if _is_printable_ascii(word) or not (wcwidth or "\x1b" in word):
+            first = max(space_left, 0)
+            rest = range(first, len(word), width)
+            return [word[:first]] + [word[i : i + width] for i in rest]
+        pieces = []
+        start = 0  # of the current piece
+        piece_width = 0
+        limit = space_left
+        for pos, w in self._word_clusters(word):
+            # the first piece may be empty if the current line is not
+            if piece_width + w > limit and (pos > start or limit < width):
+                pieces.append(word[start:pos])
+                start, piece_width, limit = pos, 0, width
+            piece_width += w
+        pieces.append(word[start:])
+        return pieces
+
+    @staticmethod
+    def _word_clusters(word):
+        """Return the start and the width of every character of `word`
+        which may begin a line, as [start, width] lists.
+
+        The width of a character includes the zero width joiners, variation
+        selectors, combining marks and ANSI color codes which follow it, so
+        that they are never separated. A hyperlink is one unit as wide as
+        its text. The widths add up to the width of the word as _len
+        measures it.
+        """
+        clusters = []
+        last = None  # the last character with a width, for a variation selector
+        joined = False  # whether the next character follows a zero width joiner
+        pos = 0
+        for code in chain(_ansi_codes.finditer(word), [None]):
+            end = code.start() if code else len(word)
+            for i in range(pos, end):
+                c = word[i]
+                if not wcwidth:
+                    clusters.append([i, 1])
+                    continue
+                if joined or c == "\u200d":
+                    joined = not joined
+                    w = 0
+                elif c == "\ufe0f":
+                    w = 0
+                    if last:  # it may make the last character wide
+                        w = wcwidth.wcswidth(last + c) - wcwidth.wcwidth(last)
+                    last = None
+                else:
+                    w = max(wcwidth.wcwidth(c), 0)
+                    if w:
+                        last = c
+                        clusters.append([i, w])
+                        continue
+                if clusters:  # a character of no width of its own
+                    clusters[-1][1] += w
+                else:
+                    clusters.append([i, w])
+            if code is None:
+                break
+            pos = code.end()
+            if code.group(4):  # a hyperlink
+                text_width = _string_width(code.group(4), False, bool(wcwidth))
+                clusters.append([code.start(), max(text_width, 0)])
+                last = None
+            elif clusters:  # a color code
+                continue
+            else:
+                clusters.append([code.start(), 0])
+        return clusters
 
     def _update_lines(self, lines, new_line):
         """Adds a new line to the list of lines the text is being wrapped into
@@ -2470,14 +4673,16 @@ class _CustomTextWrap(textwrap.TextWrapper):
         # If we're allowed to break long words, then do so: put as much
         # of the next chunk onto the current line as will fit.
         if self.break_long_words:
-            # Tabulate Custom: Build the string up piece-by-piece in order to
-            # take each charcter's width into account
-            chunk = reversed_chunks[-1]
-            i = 1
-            while self._len(chunk[:i]) <= space_left:
-                i = i + 1
-            cur_line.append(chunk[: i - 1])
-            reversed_chunks[-1] = chunk[i - 1 :]
+            # Tabulate Custom: take each charcter's width into account, and
+            # break the whole word at once rather than a line at a time
+            chunk = reversed_chunks.pop()
+            line_width = max(self.width - self._len(self.subsequent_indent), 1)
+            pieces = self._break_long_word(chunk, space_left, line_width)
+            cur_line.append(pieces[0])
+            if chunk.strip():
+                reversed_chunks.extend(reversed(pieces[1:]))
+            elif len(pieces) > 1:  # whitespace is dropped as a whole
+                reversed_chunks.append(chunk[len(pieces[0]) :])
 
         # Otherwise, we have to preserve the long word intact.  Only add
         # it to the current line if there's nothing already there --
@@ -2554,8 +4759,9 @@ class _CustomTextWrap(textwrap.TextWrapper):
             # The current line is full, and the next chunk is too big to
             # fit on *any* line (not just this one).
             if chunks and self._len(chunks[-1]) > width:
+                nchunks = len(cur_line)
                 self._handle_long_word(chunks, cur_line, cur_len, width)
-                cur_len = sum(map(self._len, cur_line))
+                cur_len += sum(map(self._len, cur_line[nchunks:]))
 
             # If the last chunk on this line is all whitespace, drop it.
             if self.drop_whitespace and cur_line and cur_line[-1].strip() == "":
@@ -2619,6 +4825,10 @@ def _main():
     -1, --header              use the first row of data as a table header
     -o FILE, --output FILE    print table to FILE (default: stdout)
     -s REGEXP, --sep REGEXP   use a custom column separator (default: whitespace)
+    --input-format FMT        read the input as csv, tsv or jsonl (JSON lines
+                              of objects or arrays) instead of splitting lines
+                              at the separator; with --header, the keys of
+                              JSON objects are the table header
     -F FPFMT, --float FPFMT   floating point number format (default: g)
     -I INTFMT, --int INTFMT   integer point number format (default: "")
     -f FMT, --format FMT      set output table format; supported formats:
@@ -2626,6 +4836,12 @@ def _main():
                               rst, mediawiki, html, latex, latex_raw,
                               latex_booktabs, latex_longtable, tsv
                               (default: simple)
+    --stream                  print rows as they are read, in constant memory
+    --sample N                with --stream, lay out the table by the first
+                              N rows (default: 1000)
+    --widths "W ..."          fixed column widths; wider text is wrapped
+    -j N, --jobs N            format up to N files at once in worker processes
+    --mmap                    map input files into memory instead of reading them
     """
     import getopt
     import sys
@@ -2635,8 +4851,23 @@ def _main():
     try:
         opts, args = getopt.getopt(
             sys.argv[1:],
-            "h1o:s:F:A:f:",
-            ["help", "header", "output", "sep=", "float=", "int=", "align=", "format="],
+            "h1o:s:F:A:f:j:",
+            [
+                "help",
+                "header",
+                "output",
+                "sep=",
+                "float=",
+                "int=",
+                "align=",
+                "format=",
+                "stream",
+                "sample=",
+                "widths=",
+                "jobs=",
+                "mmap",
+                "input-format=",
+            ],
         )
     except getopt.GetoptError as e:
         print(e)
@@ -2649,6 +4880,12 @@ def _main():
     tablefmt = "simple"
     sep = r"\s+"
     outfile = "-"
+    stream = False
+    sample = None
+    colwidths = None
+    jobs = 1
+    use_mmap = False
+    input_format = None
     for opt, value in opts:
         if opt in ["-1", "--header"]:
             headers = "firstrow"
@@ -2668,53 +4905,225 @@ def _main():
             tablefmt = value
         elif opt in ["-s", "--sep"]:
             sep = value
+        elif opt == "--stream":
+            stream = True
+        elif opt == "--mmap":
+            use_mmap = True
+        elif opt == "--input-format":
+            if value not in _input_formats:
+                print("%s is not a supported input format" % value)
+                print(usage)
+                sys.exit(3)
+            input_format = value
+        elif opt in ["-j", "--jobs", "--sample", "--widths"]:
+            try:
+                numbers = [int(n) for n in value.split()]
+            except ValueError:
+                print("%s takes whole numbers, not %r" % (opt, value))
+                print(usage)
+                sys.exit(2)
+            if opt in ["-j", "--jobs"]:
+                jobs = numbers[0] if numbers else jobs
+            elif opt == "--sample":
+                sample = numbers[0] if numbers else sample
+            else:
+                colwidths = numbers
         elif opt in ["-h", "--help"]:
             print(usage)
             sys.exit(0)
+    if sample is not None and not stream:
+        print("--sample is only used with --stream")
+        print(usage)
+        sys.exit(2)
+    options = dict(
+        headers=headers,
+        tablefmt=tablefmt,
+        sep=sep,
+        floatfmt=floatfmt,
+        intfmt=intfmt,
+        colalign=colalign,
+        stream=stream,
+        sample=1000 if sample is None else sample,
+        colwidths=colwidths,
+        input_format=input_format,
+    )
     files = [sys.stdin] if not args else args
+    files = [sys.stdin if f == "-" else f for f in files]
     with (sys.stdout if outfile == "-" else open(outfile, "w")) as out:
-        for f in files:
-            if f == "-":
-                f = sys.stdin
-            if _is_file(f):
-                _pprint_file(
-                    f,
-                    headers=headers,
-                    tablefmt=tablefmt,
-                    sep=sep,
-                    floatfmt=floatfmt,
-                    intfmt=intfmt,
-                    file=out,
-                    colalign=colalign,
-                )
-            else:
-                with open(f) as fobj:
-                    _pprint_file(
-                        fobj,
-                        headers=headers,
-                        tablefmt=tablefmt,
-                        sep=sep,
-                        floatfmt=floatfmt,
-                        intfmt=intfmt,
-                        file=out,
-                        colalign=colalign,
-                    )
+        if jobs > 1 and len(files) > 1:
+            # the tables are written in the order of the files as soon as
+            # the workers are done with them; stdin is read in this process
+            with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+                tables = [
+                    None
+                    if _is_file(f)
+                    else executor.submit(_format_file, f, use_mmap, options)
+                    for f in files
+                ]
+                for f, table in zip(files, tables):
+                    if table is None:
+                        _pprint_file(f, file=out, **options)
+                    else:
+                        out.write(table.result())
+        else:
+            for f in files:
+                if _is_file(f):
+                    _pprint_file(f, file=out, **options)
+                else:
+                    _pprint_path(f, out, use_mmap, options)
 
 
-def _pprint_file(fobject, headers, tablefmt, sep, floatfmt, intfmt, file, colalign):
-    rows = fobject.readlines()
-    table = [re.split(sep, r.rstrip()) for r in rows if r.strip()]
-    print(
-        tabulate(
+def _pprint_path(path, file, use_mmap, options):
+    """Pretty-print the file at `path` with `_pprint_file` options."""
+    if use_mmap:
+        with open(path, "rb") as fobj:
+            _pprint_file(_mapped_lines(fobj), file=file, **options)
+    else:
+        # the csv module handles the newlines in quoted values itself
+        csv_input = options.get("input_format") in ["csv", "tsv"]
+        with open(path, newline="" if csv_input else None) as fobj:
+            _pprint_file(fobj, file=file, **options)
+
+
+def _format_file(path, use_mmap, options):
+    """Return what _pprint_path would print, in a worker process."""
+    out = io.StringIO()
+    _pprint_path(path, out, use_mmap, options)
+    return out.getvalue()
+
+
+def _mapped_lines(fobject, blocksize=1 << 20):
+    """Yield the lines of a file opened in binary mode, mapping it into memory.
+
+    The lines are decoded about `blocksize` bytes at a time, as a file
+    opened with `open(path)` would decode them, with universal newlines.
+    """
+    import locale
+    import mmap
+
+    encoding = locale.getpreferredencoding(False)
+    try:
+        mapped = mmap.mmap(fobject.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # an empty file cannot be mapped
+        return
+    with mapped:
+        start = 0
+        while start < len(mapped):
+            end = mapped.find(b"\n", start + blocksize) + 1 or len(mapped)
+            text = mapped[start:end].decode(encoding)
+            yield from io.StringIO(text, newline=None)
+            start = end
+
+
+# Characters which do not match themselves in a regular expression.
+_REGEX_METACHARACTERS = ".^$*+?{}[]\\|()"
+
+
+def _row_splitter(sep):
+    """Return a function which splits a line of text into cells at `sep`.
+
+    Whitespace and single-character separators are split at with
+    `str.split`, other regular expressions are compiled once.
+
+    >>> _row_splitter(r"\\s+")("  spam  eggs")
+    ['', 'spam', 'eggs']
+    >>> _row_splitter(",")("spam,,eggs")
+    ['spam', '', 'eggs']
+    >>> _row_splitter(r"\\s*;\\s*")("spam ; eggs")
+    ['spam', 'eggs']
+
+    """
+    if sep == r"\s+":
+
+        def split(line):
+            cells = line.split()
+            # re.split() yields empty cells before and after the whitespace
+            if not line or line[0].isspace():
+                cells.insert(0, "")
+            if line[-1:].isspace():
+                cells.append("")
+            return cells
+
+        return split
+    elif len(sep) == 1 and sep not in _REGEX_METACHARACTERS:
+        return lambda line: line.split(sep)
+    else:
+        return re.compile(sep).split
+
+
+_input_formats = ["csv", "tsv", "jsonl"]
+
+
+def _read_rows(lines, sep, input_format=None):
+    """Return an iterator over the rows of a file, or of any iterable of lines.
+
+    Without an `input_format`, non-blank lines are split at `sep`.
+    Rows of JSON lines are dicts or lists, as they were written.
+
+    >>> list(_read_rows(['spam,"1,000"\\n', '\\n', 'eggs,2\\n'], None, "csv"))
+    [['spam', '1,000'], ['eggs', '2']]
+    >>> list(_read_rows(['{"item": "spam", "qty": 2}\\n'], None, "jsonl"))
+    [{'item': 'spam', 'qty': 2}]
+
+    """
+    if input_format in ["csv", "tsv"]:
+        import csv
+
+        dialect = "excel-tab" if input_format == "tsv" else "excel"
+        return (row for row in csv.reader(lines, dialect) if row)
+    elif input_format == "jsonl":
+        import json
+
+        return (json.loads(r) for r in lines if r.strip())
+    else:
+        split = _row_splitter(sep)
+        return (split(r.rstrip()) for r in lines if r.strip())
+
+
+def _pprint_file(
+    fobject,
+    headers,
+    tablefmt,
+    sep,
+    floatfmt,
+    intfmt,
+    file,
+    colalign,
+    stream=False,
+    sample=1000,
+    colwidths=None,
+    input_format=None,
+):
+    table = _read_rows(fobject, sep, input_format)
+    if headers == "firstrow" and input_format == "jsonl":
+        first = next(table, _NO_VALUE)
+        if isinstance(first, dict):
+            headers = "keys"
+        table = chain([first] if first is not _NO_VALUE else [], table)
+    if stream:
+        lines = tabulate_iter(
             table,
             headers,
             tablefmt,
             floatfmt=floatfmt,
             intfmt=intfmt,
             colalign=colalign,
-        ),
-        file=file,
-    )
+            colwidths=colwidths,
+            sample=sample,
+        )
+        if not _write_lines(lines, file):
+            file.write("\n")
+    else:
+        tabulate(
+            list(table),
+            headers,
+            tablefmt,
+            floatfmt=floatfmt,
+            intfmt=intfmt,
+            colalign=colalign,
+            colwidths=colwidths,
+            file=file,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from tabulate import tabulate
+
+
+TABULATE = str(Path(__file__).resolve().parent / "tabulate.py")
+
+ROWS = [["name", "qty", "price"], ["spam", "42", "1.5"], ["eggs", "451", "0.25"]]
+
+
+def run(*args, input=None):
+    result = subprocess.run(
+        [sys.executable, TABULATE, *args],
+        input=input,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def text(rows, sep=" "):
+    return "".join(sep.join(row) + "\n" for row in rows)
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text(text(ROWS))
+    return str(path)
+
+
+@pytest.mark.parametrize("args", [[], ["-1"], ["-1", "-f", "grid"]])
+def test_stdin(args):
+    headers = "firstrow" if "-1" in args else ()
+    tablefmt = args[-1] if "-f" in args else "simple"
+    expected = tabulate(ROWS, headers, tablefmt=tablefmt) + "\n"
+    assert run(*args, input=text(ROWS)) == expected
+
+
+@pytest.mark.parametrize("sample", [[], ["--sample", "1"]])
+def test_stream(sample):
+    expected = run("-1", "-f", "grid", input=text(ROWS))
+    streamed = run("-1", "-f", "grid", "--stream", *sample, input=text(ROWS))
+    if sample:  # only the first row is measured
+        assert streamed.split("\n")[0] == "+--------+-------+---------+"
+    else:
+        assert streamed == expected
+
+
+def test_sample_without_stream():
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        run("--sample", "1", input=text(ROWS))
+    assert e.value.returncode == 2
+    assert "--sample is only used with --stream" in e.value.stdout
+
+
+def test_widths():
+    expected = tabulate(ROWS, "firstrow", colwidths=[3, 5, 6]) + "\n"
+    assert run("-1", "--widths", "3 5 6", input=text(ROWS)) == expected
+
+
+def test_bad_widths():
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        run("--widths", "a b", input=text(ROWS))
+    assert e.value.returncode == 2
+
+
+def test_files(data_file):
+    expected = tabulate(ROWS, "firstrow") + "\n"
+    assert run("-1", data_file) == expected
+    assert run("-1", "--mmap", data_file) == expected
+    assert run("-1", "-j", "2", data_file, data_file) == expected * 2
+    assert run("-1", "-j", "2", "--mmap", data_file, "-", input="a b\n") == (
+        expected + tabulate([["a", "b"]], "firstrow") + "\n"
+    )
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert run("--mmap", str(path)) == run(str(path))
+
+
+@pytest.mark.parametrize("input_format, sep", [("csv", ","), ("tsv", "\t")])
+def test_input_format_csv(input_format, sep):
+    rows = ROWS + [["fried eggs", "", "2"]]
+    expected = tabulate(rows, "firstrow") + "\n"
+    assert run("-1", "--input-format", input_format, input=text(rows, sep)) == expected
+
+
+def test_input_format_jsonl():
+    objects = [{"name": "spam", "qty": 42}, {"name": "eggs", "qty": 451}]
+    lines = "".join(json.dumps(o) + "\n" for o in objects)
+    expected = tabulate(objects, "keys") + "\n"
+    assert run("-1", "--input-format", "jsonl", input=lines) == expected
+    arrays = "".join(json.dumps(row) + "\n" for row in ROWS)
+    assert run("--input-format", "jsonl", input=arrays) == tabulate(ROWS) + "\n"
+
+
+def test_rows_wider_than_header():
+    expected = "  a    b\n---  ---\n  1    2\n  3    4\n"
+    assert run("-1", input="a b\n1 2\n3 4 y\n") == expected
@@ -0,0 +1,166 @@
+import pytest
+import tabulate as tabulate_module
+from tabulate import _memoize_column, tabulate
+
+
+def recording(fn):
+    calls = []
+
+    def recording_fn(val, *args, **kwargs):
+        calls.append(val)
+        return fn(val, *args, **kwargs)
+
+    return recording_fn, calls
+
+
+def test_memoize_column():
+    fn, calls = recording(repr)
+    memo_fn = _memoize_column(fn, maxsize=10)
+    values = [1, True, 1.0, 1, 0.0, -0.0, 0.0, None, None, "1", b"1", "1", [1], [1]]
+    assert list(map(memo_fn, values)) == list(map(repr, values))
+    # equal values of other types or signs are told apart; lists are not
+    # remembered
+    assert calls == [1, True, 1.0, 0.0, -0.0, None, "1", b"1", [1], [1]]
+
+
+def test_memoize_column_distinct_values():
+    fn, calls = recording(str)
+    memo_fn = _memoize_column(fn, maxsize=3)
+    assert [memo_fn(v) for v in [1, 2, 3, 4, 1, 4]] == ["1", "2", "3", "4", "1", "4"]
+    # 4 is not remembered, and no value repeated while the memo filled up,
+    # so the values are no longer looked up
+    assert calls == [1, 2, 3, 4, 1, 4]
+
+
+def test_memoize_column_disabled(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "COLUMN_MEMO_SIZE", 0)
+    assert _memoize_column(str) is str
+    assert _memoize_column(len, maxsize=10) is len
+
+
+def test_low_cardinality_columns(monkeypatch):
+    rows = [["ok" if i % 3 else "failed", i % 2, 0.5 * (i % 4)] for i in range(300)]
+    monkeypatch.setattr(tabulate_module, "COLUMN_MEMO_SIZE", 0)
+    expected = tabulate(rows, floatfmt=".2f")
+    monkeypatch.undo()
+    format_fn, calls = recording(tabulate_module._format)
+    monkeypatch.setattr(tabulate_module, "_format", format_fn)
+    assert tabulate(rows, floatfmt=".2f") == expected
+    assert calls == ["failed", "ok", 0, 1, 0.0, 0.5, 1.0, 1.5]  # once per value
+
+
+@pytest.mark.parametrize(
+    "padfn, spec",
+    [
+        (tabulate_module._padleft, ">"),
+        (tabulate_module._padright, "<"),
+        (tabulate_module._padboth, "^"),
+    ],
+)
+@pytest.mark.parametrize("width", [0, 3, 6, 7])
+def test_pad_functions(padfn, spec, width):
+    strings = ["", "a", "spam", "яйца", "too long"]
+    expected = ["{:{}{}}".format(s, spec, width) for s in strings]
+    assert [padfn(width, s) for s in strings] == expected
+    assert tabulate_module._pad_column(padfn, width, strings) == expected
+
+
+@pytest.mark.parametrize(
+    "alignment, expected",
+    [
+        ("left", ["1.5      ", "22       ", "-333.25  ", "x        "]),
+        ("right", ["      1.5", "       22", "  -333.25", "        x"]),
+        ("center", ["   1.5   ", "   22    ", " -333.25 ", "    x    "]),
+        ("decimal", ["     1.5 ", "   22    ", "  -333.25", "     x   "]),
+        (None, [" 1.5", "22 ", "-333.25", "x"]),
+    ],
+)
+def test_align_column(alignment, expected):
+    strings = [" 1.5", "22 ", "-333.25", "x"]
+    aligned = tabulate_module._align_column(strings, alignment, 9, has_invisible=False)
+    assert aligned == expected
+
+
+def test_ansi_codes_are_looked_for_per_column():
+    rows = [["\x1b[31mred\x1b[0m", "plain", 1.5], ["x", "more plain", 22]]
+    tabulate_module._cell_width_paths.clear()
+    table = tabulate(rows, headers=["c", "p", "n"])
+    # only the cells of the colored column are measured without their codes
+    assert tabulate_module._cell_width_paths == {"ansi": 2, "len": 4}
+    plain_rows = [["red", "plain", 1.5], ["x", "more plain", 22]]
+    plain_table = tabulate(plain_rows, headers=["c", "p", "n"])
+    assert tabulate_module._strip_ansi(table) == plain_table
+
+
+def test_has_invisible_codes_stops_at_the_first_one():
+    def strings():
+        yield "plain"
+        yield "\x1b[31mred\x1b[0m"
+        raise AssertionError("looked past the first code")
+
+    assert tabulate_module._has_invisible_codes(strings())
+    assert not tabulate_module._has_invisible_codes(["plain", "\x1b", "[31m"])
+
+
+def test_wide_characters_are_measured_per_cell(monkeypatch):
+    wcwidth = pytest.importorskip("wcwidth")
+    monkeypatch.setattr(tabulate_module, "WIDE_CHARS_MODE", True)
+    measured = []
+    wcswidth = wcwidth.wcswidth
+
+    def recording_wcswidth(s, *args, **kwargs):
+        measured.append(s)
+        return wcswidth(s, *args, **kwargs)
+
+    monkeypatch.setattr(wcwidth, "wcswidth", recording_wcswidth)
+    tabulate_module._width_cache.cache_clear()
+    tabulate_module._cell_width_paths.clear()
+    table = tabulate([["spam", 1], ["日本", 2], ["eggs", 3]], headers=["名前", "n"])
+    assert tabulate_module._cell_width_paths == {"len": 5, "wcwidth": 1}
+    assert measured and not any(map(str.isascii, measured))
+    assert {wcswidth(line) for line in table.split("\n")} == {11}
+    tabulate_module._cell_width_paths.clear()
+    tabulate([["spam", 1], ["eggs", 3]], headers=["名前", "n"])
+    assert tabulate_module._cell_width_paths["wcwidth"] == 0
+
+
+def test_width_cache(monkeypatch):
+    pytest.importorskip("wcwidth")
+    monkeypatch.setattr(tabulate_module, "WIDE_CHARS_MODE", True)
+    cache = tabulate_module._width_cache
+    cache.cache_clear()
+    rows = [["\x1b[31mspam\x1b[0m", "日本"], ["eggs", "ascii"]]
+    table = tabulate(rows)
+    info = cache.cache_info()
+    assert info.currsize > 0
+    # the second time, every width is found in the cache
+    assert tabulate(rows) == table
+    assert cache.cache_info().misses == info.misses
+    assert cache.cache_info().hits > info.hits
+
+
+def test_width_cache_key():
+    pytest.importorskip("wcwidth")
+    colored = "\x1b[31m日本\x1b[0m"
+    assert tabulate_module._cached_width(colored, True, True) == 4
+    assert tabulate_module._cached_width(colored, True, False) == 2
+    assert tabulate_module._cached_width(colored, False, False) == len(colored)
+
+
+def test_width_cache_size(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "WIDTH_CACHE_SIZE", 2)
+    for s in ["一", "二", "三", "spam"]:
+        tabulate_module._visible_width(s)
+    info = tabulate_module._width_cache.cache_info()
+    # printable ASCII strings are not cached
+    assert (info.maxsize, info.currsize, info.misses) == (2, 2, 3)
+
+
+def test_width_cache_is_not_used_by_the_wrapper():
+    pytest.importorskip("wcwidth")
+    tabulate_module._visible_width("日本")  # the cache is made for WIDTH_CACHE_SIZE
+    tabulate_module._width_cache.cache_clear()
+    word = "\x1b[31m" + "x" * 2000 + "\x1b[0m"
+    lines = tabulate_module._CustomTextWrap(width=10).wrap(word + " 日本語 " + word)
+    assert len(lines) == 401
+    assert tabulate_module._width_cache.cache_info().currsize == 0
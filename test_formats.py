@@ -0,0 +1,124 @@
+import pytest
+import tabulate as T
+from tabulate import _latex_row, tabulate
+
+
+def test_latex_row():
+    cells = ["a&b", "50%", "x_y", "~\\", "plain"]
+    expected = r"a\&b&50\%&x\_y&\textasciitilde{}\textbackslash{}&plain\\"
+    assert _latex_row(cells, [1] * 5, ["left"] * 5) == expected
+
+
+def test_latex_row_escrules():
+    # only rules for single characters take effect
+    escrules = {"&": "AND", "ab": "X"}
+    assert _latex_row(["a&b", "ab"], [1, 1], ["left"] * 2, escrules) == "aANDb&ab\\\\"
+    assert _latex_row(["a&b"], [1], ["left"], {}) == "a&b\\\\"
+
+
+def test_latex_escape_rules_changes(monkeypatch):
+    monkeypatch.setitem(T.LATEX_ESCAPE_RULES, "@", r"\at{}")
+    table = tabulate([["a@b"]], tablefmt="latex")
+    assert r"a\at{}b" in table
+    monkeypatch.delitem(T.LATEX_ESCAPE_RULES, "@")
+    assert r"\at" not in tabulate([["a@b"]], tablefmt="latex")
+
+
+@pytest.mark.parametrize("tablefmt", ["latex", "latex_booktabs", "latex_longtable"])
+def test_latex_escapes_cells(tablefmt):
+    table = tabulate([["a&b", 1]], ["h_1", "h2"], tablefmt=tablefmt)
+    assert r" a\&b " in table and r" h\_1 " in table
+
+
+def test_latex_raw():
+    expected = "\n".join(
+        [
+            r"\begin{tabular}{lr}",
+            r"\hline",
+            r" h_1   &   h2 \\",
+            r"\hline",
+            r" a&b   &    1 \\",
+            r"\hline",
+            r"\end{tabular}",
+        ]
+    )
+    assert tabulate([["a&b", 1]], ["h_1", "h2"], tablefmt="latex_raw") == expected
+
+
+def test_latex_escaper_is_built_once_per_rules():
+    T._latex_escaper.cache_clear()
+    tabulate([["a&b"]] * 100, tablefmt="latex_longtable")
+    info = T._latex_escaper.cache_info()
+    assert info.misses == 1 and info.hits == 99
+
+
+ALIGNS = ["left", "right", "center", "decimal"]
+
+
+@pytest.mark.parametrize(
+    "row, expected",
+    [
+        (
+            T._html_row_with_attrs("td", False, ["<a>", "1%", "x", "2"], [], ALIGNS),
+            '<tr><td>&lt;a&gt;</td><td style="text-align: right;">1%</td>'
+            '<td style="text-align: center;">x</td>'
+            '<td style="text-align: right;">2</td></tr>',
+        ),
+        (
+            T._html_row_with_attrs("th", True, ["<a>"], [], ALIGNS[:1]),
+            "<table>\n<thead>\n<tr><th><a></th></tr>\n</thead>\n<tbody>",
+        ),
+        (
+            T._mediawiki_row_with_attrs("|", ["a", "1%", "x", "2"], [], ALIGNS),
+            '| a || align="right"| 1% || align="center"| x || align="right"| 2',
+        ),
+        (
+            T._moin_row_with_attrs("||", ["a", "1%"], [], ALIGNS[:2], "'''"),
+            "|| '''a''' ||<style=\"text-align: right;\"> '''1%''' ||",
+        ),
+        (
+            T._textile_row_with_attrs(["a", "1%", "x", "2"], [], ALIGNS),
+            "|<.a |>.1%|=.x|>.2|",
+        ),
+        (
+            T._asciidoc_row(True, ["a", "1%"], [3, 4], ALIGNS[:2]),
+            '[cols="3<,4>",options="header"]\n|====\n|a|1%',
+        ),
+        (T._asciidoc_row(False, ["a", "1%"], [3, 4], ALIGNS[:2]), "|a|1%"),
+    ],
+)
+def test_row_templates(row, expected):
+    assert row == expected
+
+
+def test_row_templates_with_fewer_alignments_than_cells():
+    # only the columns with an alignment are shown
+    cells = ["<a>", "1", "x"]
+    expected = '<tr><td>&lt;a&gt;</td><td style="text-align: right;">1</td></tr>'
+    assert T._html_row_with_attrs("td", False, cells, [], ALIGNS[:2]) == expected
+    assert T._textile_row_with_attrs(cells, [], ALIGNS[:1]) == "|<.<a> |"
+    assert T._html_row_with_attrs("td", False, cells, [], []) == "<tr></tr>"
+
+
+def test_escape_html_columns(monkeypatch):
+    monkeypatch.setattr(T, "_html_escape_columns", T.Counter())
+    rows = [["a", "<b>", "1"], ["c", "d&e", "2"]]
+    table = tabulate(rows, ["x", "y", "z"], tablefmt="html")
+    assert "<td>&lt;b&gt;</td>" in table and "<td>d&amp;e</td>" in table
+    assert T._html_escape_columns == {"skipped": 2, "escaped": 1}
+    fmt, escaped = T._escape_html_columns(T._table_formats["html"], rows)
+    assert escaped == [("a", "&lt;b&gt;", "1"), ("c", "d&amp;e", "2")]
+    assert fmt.datarow(escaped[0], [], ["left"] * 3) == (
+        "<tr><td>a</td><td>&lt;b&gt;</td><td>1</td></tr>"
+    )
+
+
+def test_escape_html_columns_skips_other_formats():
+    fmt = T._table_formats["unsafehtml"]
+    rows = [["<b>"]]
+    assert T._escape_html_columns(fmt, rows) == (fmt, rows)
+    assert "<td><b></td>" in tabulate(rows, tablefmt="unsafehtml")
+    fmt = T._table_formats["html"]
+    escaped_fmt, escaped_rows = T._escape_html_columns(fmt, rows)
+    assert escaped_fmt is fmt and escaped_rows is rows  # every column is dirty
+    assert "<td>&lt;b&gt;</td>" in tabulate(rows, tablefmt="html")
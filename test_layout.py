@@ -0,0 +1,146 @@
+import pytest
+from tabulate import IncrementalTable, TableLayout, tabulate, tabulate_iter
+
+
+FORMATS = ["plain", "simple", "grid", "pipe", "psql", "rst", "html", "latex", "pretty"]
+
+TABLES = [
+    [["spam", 41.9999], ["eggs", "451.0"]],
+    [["a", 1, None], ["b", "x", 2.25], ["", 1000000, "c"]],
+    [["one\ntwo", 1], ["three", 22]],
+    [],
+]
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+def test_table_layout_render(tablefmt):
+    layout = TableLayout(["h1", "h2"], tablefmt=tablefmt, floatfmt=".2f")
+    for rows in TABLES:
+        expected = tabulate(rows, ["h1", "h2"], tablefmt=tablefmt, floatfmt=".2f")
+        assert layout.render(rows) == expected
+
+
+def test_table_layout_freeze():
+    layout = TableLayout(["item", "qty"], freeze=True)
+    first = layout.render([["spam", 42], ["eggs", 451]])
+    assert first == tabulate([["spam", 42], ["eggs", 451]], ["item", "qty"])
+    # later tables keep the widths of the first one
+    assert layout.render([["ham", 7]]).split("\n")[-1] == "ham         7"
+    layout.reset()
+    assert layout.render([["ham", 7]]) == tabulate([["ham", 7]], ["item", "qty"])
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+@pytest.mark.parametrize("overflow", ["wrap", "truncate"])
+def test_colwidths(tablefmt, overflow):
+    rows = [["spam", "Lovely spam, wonderful spam"], ["eggs", 451.5]]
+    table = tabulate(
+        rows, ["item", "note"], tablefmt=tablefmt, colwidths=[6, 12], overflow=overflow
+    )
+    assert "Lovely spam," in table
+    assert ("wonderful" in table) == (overflow == "wrap")
+    layout = TableLayout(
+        ["item", "note"], tablefmt=tablefmt, colwidths=[6, 12], overflow=overflow
+    )
+    assert layout.render(rows) == table
+
+
+def test_colwidths_are_the_column_widths():
+    rows = [["a", "bcdefgh ijk"], ["lmnop", "q"]]
+    lines = tabulate(rows, tablefmt="grid", colwidths=9).split("\n")
+    assert lines[0] == "+-----------+-----------+"
+    assert set(map(len, lines)) == {len(lines[0])}
+
+
+def test_colwidths_unmeasured_columns():
+    rows = [["a", "bcdefgh ijk"], ["lmnop", "q"]]
+    lines = tabulate(rows, colwidths=[2, None]).split("\n")
+    assert lines[0] == "--  -----------"  # as wide as "bcdefgh ijk"
+    assert lines[2:5] == ["lm  q", "no", "p"]
+
+
+@pytest.mark.parametrize("widths", ["colwidths", "maxcolwidths"])
+def test_colwidths_bytes(widths):
+    rows = [[b"spam eggs", b"123456"]]
+    expected = tabulate([["spam eggs", "123456"]], disable_numparse=True, **{widths: 4})
+    assert tabulate(rows, disable_numparse=True, **{widths: 4}) == expected
+    assert expected == "----  ----\nspam  1234\neggs  56\n----  ----"
+
+
+def test_colwidths_numbers_are_not_wrapped():
+    rows = [[123456789, "a b"]]
+    expected = "----  -\n123,456,789  a\n      b\n----  -"
+    assert tabulate(rows, intfmt=",", colwidths=[4, 1]) == expected
+    # unless they are text
+    table = tabulate(rows, intfmt="05d", colwidths=[4, 1], disable_numparse=[0])
+    assert table == "----  -\n1234  a\n5678  b\n9\n----  -"
+    rows = [["True", 1], ["x", 22]]
+    assert tabulate(rows, colwidths=3) == "---  ---\nTru    1\ne\nx     22\n---  ---"
+
+
+@pytest.mark.parametrize("headers", [[], ["a", "b"]])
+@pytest.mark.parametrize("widths", ["colwidths", "maxcolwidths", "maxheadercolwidths"])
+def test_colwidths_empty_table(headers, widths):
+    expected = tabulate([], headers)
+    kwargs = dict(disable_numparse=[0], **{widths: 3})
+    assert tabulate([], headers, **kwargs) == expected
+    assert "\n".join(tabulate_iter(iter([]), headers, **kwargs)) == expected
+
+
+def test_colwidths_narrower_than_a_character():
+    pytest.importorskip("wcwidth")
+    # every wide character has a line of its own
+    assert tabulate([["日本語"]], colwidths=1) == "-\n日\n本\n語\n-"
+
+
+def test_overflow_error():
+    with pytest.raises(ValueError):
+        tabulate([["a"]], colwidths=3, overflow="ellipsis")
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+def test_incremental_table(tablefmt):
+    headers = ["event", "ms"]
+    table = IncrementalTable(headers, tablefmt=tablefmt)
+    rows = []
+    for new_rows in [[["start", 12], ["load", 250]], [["parse", 31]], [["run", 9]]]:
+        lines = table.append(new_rows)
+        rows.extend(new_rows)
+        expected = tabulate(rows, headers, tablefmt=tablefmt)
+        assert table.render() == expected
+        if lines is not None:  # the new lines are those of the whole table
+            assert "\n".join(lines) in expected
+
+
+def test_incremental_table_grows():
+    table = IncrementalTable(["event", "ms"])
+    assert table.append([["start", 12]]) is None
+    assert table.append([["parse", 31]]) == ["parse      31"]
+    assert table.append([["render", 15000]]) is None
+    assert table.append([["slow", 2.5]]) is None
+    rows = [["start", 12], ["parse", 31], ["render", 15000], ["slow", 2.5]]
+    assert table.render() == tabulate(rows, ["event", "ms"])
+
+
+def test_incremental_table_disable_numparse_without_headers():
+    table = IncrementalTable(disable_numparse=[0])
+    table.append([["007", "1.50"]])
+    assert table.render() == tabulate([["007", "1.50"]], disable_numparse=[0])
+
+
+def test_incremental_table_rst_escapes_empty_first_cells():
+    table = IncrementalTable(["", "qty"], tablefmt="rst")
+    rows = [["spam", 42], ["", 451]]
+    table.append(rows[:1])
+    lines = table.append(rows[1:])
+    assert lines == ["..      451"]
+    assert table.render() == tabulate(rows, ["", "qty"], tablefmt="rst")
+
+
+@pytest.mark.parametrize("tablefmt", ["simple", "grid", "rst", "latex"])
+def test_incremental_table_rows_wider_than_headers(tablefmt):
+    rows = [["x", 1, "z"], ["", 2], ["q", 3, "w", "e"]]
+    table = IncrementalTable(["a", "b"], tablefmt=tablefmt)
+    for row in rows:
+        table.append([row])
+    assert table.render() == tabulate(rows, ["a", "b"], tablefmt=tablefmt)
@@ -0,0 +1,83 @@
+import pytest
+import tabulate as tabulate_module
+from tabulate import tabulate
+
+np = pytest.importorskip("numpy")
+
+
+def count_type_calls(monkeypatch):
+    calls = []
+    type_fn = tabulate_module._type
+
+    def counting_type(*args, **kwargs):
+        calls.append(args[0])
+        return type_fn(*args, **kwargs)
+
+    monkeypatch.setattr(tabulate_module, "_type", counting_type)
+    return calls
+
+
+def test_numeric_array_types_from_dtype(monkeypatch):
+    calls = count_type_calls(monkeypatch)
+    array = np.array([[1, 2], [3, 40]])
+    table = tabulate(array, ["a", "b"], floatfmt=".1f", showindex=True)
+    assert table == "\n".join(
+        [
+            "      a     b",
+            "--  ---  ----",
+            " 0  1.0   2.0",
+            " 1  3.0  40.0",
+        ]
+    )
+    assert calls == [0, 1]  # only the values of the index are typed
+
+
+def test_float_array():
+    table = tabulate(np.array([[1.5, 2], [3, -40.25]]), tablefmt="grid")
+    assert table == "\n".join(
+        [
+            "+-----+--------+",
+            "| 1.5 |   2    |",
+            "+-----+--------+",
+            "| 3   | -40.25 |",
+            "+-----+--------+",
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array([[True, False]]),
+        np.array([[1, 2]], dtype=np.uint8),
+        np.array([[1e20, float("nan")], [float("inf"), -0.0]]),
+    ],
+)
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"floatfmt": ".2f"}, {"floatfmt": "_>8.1f"}, {"showindex": True}]
+)
+def test_numeric_array_as_floats(array, kwargs):
+    # numpy numbers are formatted as floats, whatever the dtype
+    floats = [[float(v) for v in row] for row in array]
+    assert tabulate(array, **kwargs) == tabulate(floats, **kwargs)
+
+
+def test_object_array_types_from_values(monkeypatch):
+    calls = count_type_calls(monkeypatch)
+    assert tabulate(np.array([[1, "a"]], dtype=object)) == "-  -\n1  a\n-  -"
+    assert calls == [1, "a"]
+
+
+def test_record_array():
+    array = np.array([(1, 2.5, "a")], dtype=[("x", "i4"), ("y", "f8"), ("z", "U1")])
+    expected = "  x    y  z\n---  ---  ---\n  1  2.5  a"
+    assert tabulate(array, headers="keys") == expected
+
+
+def test_data_frame(monkeypatch):
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"a": [1, 3], "b": [2.5, 40.0]}, index=["x", "y"])
+    calls = count_type_calls(monkeypatch)
+    table = tabulate(frame, headers="keys")
+    assert calls == ["x", "y"]  # only the values of the index are typed
+    assert table == tabulate([["x", 1.0, 2.5], ["y", 3.0, 40.0]], ["", "a", "b"])
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+import tabulate as tabulate_module
+from tabulate import TableLayout, tabulate
+
+
+FORMATS = ["simple", "grid", "pipe", "rst", "html", "latex"]
+
+
+def rows(n):
+    return [["row %d" % i, i * 1.5, "x" * (i % 7)] for i in range(n)]
+
+
+class Writes(io.StringIO):
+    "A text file which counts its writes."
+
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+def test_file(tablefmt):
+    data = rows(50)
+    out = io.StringIO()
+    n = tabulate(data, ["a", "b", "c"], tablefmt=tablefmt, file=out)
+    expected = tabulate(data, ["a", "b", "c"], tablefmt=tablefmt) + "\n"
+    assert out.getvalue() == expected
+    assert n == len(expected)
+
+
+def test_file_chunks(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "WRITE_BUFFER_SIZE", 100)
+    data = rows(20)
+    out = Writes()
+    TableLayout(tablefmt="grid").render(data, file=out)
+    expected = tabulate(data, tablefmt="grid") + "\n"
+    assert out.getvalue() == expected
+    # lines are written together, about WRITE_BUFFER_SIZE characters at a time
+    assert 1 < out.writes <= len(expected) // 100 + 1
+
+
+def test_file_empty():
+    out = io.StringIO()
+    assert tabulate([], file=out) == 1
+    assert out.getvalue() == "\n"
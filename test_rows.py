@@ -0,0 +1,119 @@
+import pytest
+import tabulate as T
+from tabulate import SEPARATING_LINE, simple_separated_format, tabulate
+
+
+FORMATS = sorted(T._table_formats.items()) + [
+    ("separated", simple_separated_format(";"))
+]
+
+
+@pytest.mark.parametrize("name, fmt", FORMATS)
+@pytest.mark.parametrize("cells", [["a", " 1"], ["", ""], []])
+@pytest.mark.parametrize("pad", [0, 1])
+def test_compile_row(name, fmt, cells, pad):
+    colwidths = [1, 2]
+    colaligns = ["left", "right"]
+    padded = T._pad_row(cells, pad)
+    for rowfmt in [fmt.headerrow, fmt.datarow]:
+        expected = T._build_row(padded, colwidths, colaligns, rowfmt)
+        build_row = T._compile_row(rowfmt, colwidths, colaligns, pad)
+        assert build_row(cells) == expected
+
+
+def test_separating_line_with_padding():
+    # formats with padding show SEPARATING_LINE as a data row
+    rows = [["a", 1], SEPARATING_LINE, ["b", 2]]
+    assert tabulate(rows, ["x", "y"], tablefmt="psql") == "\n".join(
+        [
+            "+-----+-----+",
+            "| x   |   y |",
+            "|-----+-----|",
+            "| a   |   1 |",
+            "| \x01 |",
+            "| b   |   2 |",
+            "+-----+-----+",
+        ]
+    )
+    assert tabulate(rows, tablefmt="simple") == "-  -\na  1\n-  -\nb  2\n-  -"
+
+
+def test_line_between_rows():
+    rows = [["a", 1], SEPARATING_LINE, ["b", 2]]
+    assert tabulate(rows, ["x", "y"], tablefmt="grid") == "\n".join(
+        [
+            "+-----+-----+",
+            "| x   |   y |",
+            "+=====+=====+",
+            "| a   |   1 |",
+            "+-----+-----+",
+            "| \x01 |",
+            "+-----+-----+",
+            "| b   |   2 |",
+            "+-----+-----+",
+        ]
+    )
+
+
+def test_lines_are_built_once(monkeypatch):
+    calls = []
+    build_line = T._build_line
+
+    def counting_build_line(*args):
+        calls.append(args)
+        return build_line(*args)
+
+    monkeypatch.setattr(T, "_build_line", counting_build_line)
+    rows = [["a", 1], SEPARATING_LINE] * 50
+    tabulate(rows, ["x", "y"], tablefmt="grid")
+    # above, below the header, between rows and below
+    assert len(calls) == 4
+
+
+@pytest.mark.parametrize("cell", ["a\nb", "a\r\nb", "a\x0bb", "a b", "a\nb\n"])
+@pytest.mark.parametrize(
+    "rowalign, expected",
+    [
+        (None, ["|a|x|", "|b| |"]),
+        ("top", ["|a|x|", "|b| |"]),
+        ("center", ["|a|x|", "|b| |"]),
+        ("bottom", ["|a| |", "|b|x|"]),
+    ],
+)
+def test_multiline_row_lines(cell, rowalign, expected):
+    build_line = T._compile_row(T.DataRow("|", "|", "|"), [1, 1], ["left"] * 2, 0)
+    lines = T._multiline_row_lines([cell, "x"], [1, 1], build_line, rowalign)
+    assert lines == expected
+
+
+def test_multiline_row_lines_center():
+    build_line = T._compile_row(T.DataRow("", " ", ""), [1, 1], ["left"] * 2, 0)
+    lines = T._multiline_row_lines(["a\nb\nc", "x"], [1, 1], build_line, "center")
+    assert lines == ["a", "b x", "c"]
+
+
+def test_multiline_rows_of_one_line_are_not_split(monkeypatch):
+    monkeypatch.setattr(T, "_align_cell_veritically", None)
+    build_line = T._compile_row(T.DataRow("|", "|", "|"), [1, 1], ["left"] * 2, 0)
+    assert T._multiline_row_lines(["a", "x"], [1, 1], build_line) == ["|a|x|"]
+
+
+@pytest.mark.parametrize(
+    "rowalign, expected",
+    [
+        ("top", ["| a   | x   |", "| b   |     |"]),
+        ("bottom", ["| a   |     |", "| b   | x   |"]),
+    ],
+)
+def test_multiline_table_rowalign(rowalign, expected):
+    table = tabulate(
+        [["a\r\nb", "x"], ["yy", "z"]], ["h", "k"], tablefmt="grid", rowalign=rowalign
+    )
+    assert table.splitlines()[3:5] == expected
+
+
+def test_multiline_row_of_empty_cells():
+    build_line = T._compile_row(T.DataRow("|", "|", "|"), [1, 1], ["left"] * 2, 0)
+    assert T._multiline_row_lines(["", ""], [1, 1], build_line) == ["| | |"]
+    table = tabulate([["a\nb", 1], ["", ""], ["c", 2]], tablefmt="orgtbl")
+    assert table == "| a | 1 |\n| b |   |\n|   |   |\n| c | 2 |"
@@ -0,0 +1,152 @@
+import pytest
+from tabulate import SEPARATING_LINE, tabulate, tabulate_formats, tabulate_iter
+
+
+FORMATS = ["plain", "simple", "grid", "pipe", "psql", "rst", "html", "latex", "pretty"]
+
+TABLES = {
+    "strings": [["spam", "eggs"], ["bacon", "sausage"], ["ham", ""]],
+    "numbers": [[1, 2.5], [-12, 1e20], [3, "451.0"]],
+    "mixed": [["a", 1, None], ["b", "x", 2.25], ["", 1000000, "c"]],
+    "multiline": [["one\ntwo", 1], ["three", 22]],
+    "separated": [["a", 1], SEPARATING_LINE, ["b", 22]],
+}
+
+
+def render(rows, **kwargs):
+    return "\n".join(tabulate_iter(rows, **kwargs))
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+@pytest.mark.parametrize("name", sorted(TABLES))
+@pytest.mark.parametrize("sample", [None, 1000])
+def test_tabulate_iter_generator(tablefmt, name, sample):
+    rows = TABLES[name]
+    table = render(iter(rows), tablefmt=tablefmt, sample=sample)
+    assert table == tabulate(rows, tablefmt=tablefmt)
+
+
+@pytest.mark.parametrize("sample", [1, 1000])
+def test_tabulate_iter_firstrow_and_index(sample):
+    rows = [["name", "qty"], ["spam", 42], ["eggs", 451], ["ham", 7]]
+    kwargs = dict(headers="firstrow", showindex="always", tablefmt="grid")
+    assert render(iter(rows), sample=sample, **kwargs) == tabulate(rows, **kwargs)
+
+
+def test_tabulate_iter_rows_after_sample():
+    rows = [[n, 2**n] for n in (1, 2, 3, 10, 20)]
+    lines = list(tabulate_iter(iter(rows), ["n", "2**n"], sample=3))
+    # the rows after the sample are not measured, only formatted
+    assert lines[:5] == tabulate(rows[:3], ["n", "2**n"]).split("\n")
+    assert lines[5:] == [" 10    1024", " 20  1048576"]
+
+
+def test_tabulate_iter_is_lazy():
+    def rows():
+        yield ["spam", 42]
+        yield ["eggs", 451]
+        raise AssertionError("read past the sample")
+
+    lines = tabulate_iter(rows(), sample=1)
+    assert [next(lines) for _ in range(2)] == ["----  --", "spam  42"]
+
+
+@pytest.mark.parametrize("maxcolwidths", [8, [None, 8]])
+def test_tabulate_iter_maxcolwidths(maxcolwidths):
+    rows = [["a", "long words here to wrap"], ["b", "short"]]
+    kwargs = dict(maxcolwidths=maxcolwidths, tablefmt="grid")
+    assert render(iter(rows), **kwargs) == tabulate(rows, **kwargs)
+
+
+def test_tabulate_iter_empty():
+    assert render([], headers=["a", "b"]) == tabulate([], headers=["a", "b"])
+    assert render(iter([])) == tabulate([])
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+@pytest.mark.parametrize("name", sorted(TABLES))
+def test_tabulate_iter_two_pass(tablefmt, name):
+    rows = TABLES[name]
+    table = render(rows, headers=["h1", "h2"], tablefmt=tablefmt, sample=None)
+    assert table == tabulate(rows, headers=["h1", "h2"], tablefmt=tablefmt)
+
+
+def test_tabulate_iter_two_pass_firstrow_and_index():
+    rows = [["name", "qty"], ["spam", 42], ["eggs", 451], ["ham", 7]]
+    kwargs = dict(headers="firstrow", showindex=iter("abc"), tablefmt="grid")
+    table = render(rows, sample=None, **kwargs)
+    kwargs["showindex"] = list("abc")
+    assert table == tabulate(rows, **kwargs)
+
+
+def test_tabulate_iter_two_pass_list_of_dicts():
+    rows = [{"a": 1, "b": "x"}, {"a": 22, "c": 3.5}]
+    table = render(rows, headers="keys", sample=None)
+    assert table == tabulate(rows, headers="keys")
+
+
+def test_tabulate_iter_two_pass_disable_numparse_without_rows():
+    table = render(range(0), headers=["a", "b"], disable_numparse=[0], sample=None)
+    assert table == tabulate([], headers=["a", "b"], disable_numparse=[0])
+
+
+class Query:
+    "Rows which are fetched anew whenever they are iterated over."
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.runs = 0
+
+    def __iter__(self):
+        self.runs += 1
+        return iter(self.rows)
+
+
+@pytest.mark.parametrize("headers", [(), "firstrow"])
+def test_tabulate_iter_reads_twice(headers):
+    query = Query([["name", "qty"], ["spam", 42], ["eggs", 451]])
+    table = render(query, headers=headers, showindex=True, sample=None)
+    assert table == tabulate(query.rows, headers, showindex=True)
+    assert query.runs == 2
+
+
+def test_tabulate_iter_dicts_read_three_times():
+    query = Query([{"a": 1, "b": "x"}, {"a": 22, "c": 3.5}])
+    table = render(query, headers="keys", sample=None)
+    assert table == tabulate(query.rows, headers="keys")
+    assert query.runs == 3  # once more to find all the keys
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+def test_tabulate_iter_fixed_widths(tablefmt):
+    rows = [["a", "short"], ["b", "a much longer text to wrap"], ["c", 12.5]]
+    kwargs = dict(headers=["k", "text"], colwidths=[3, 10], tablefmt=tablefmt)
+    assert render(iter(rows), **kwargs) == tabulate(rows, **kwargs)
+
+
+@pytest.mark.parametrize("tablefmt", ["plain", "simple", "grid", "psql", "rst"])
+def test_tabulate_iter_fixed_widths_after_sample(tablefmt):
+    # only the first row is read ahead, the second one is wrapped
+    rows = [["a", "short"], ["b", "a much longer text to wrap"], ["", ""]]
+    kwargs = dict(headers=["k", "text"], colwidths=[3, 10], tablefmt=tablefmt)
+    assert render(iter(rows), sample=1, **kwargs) == tabulate(rows, **kwargs)
+
+
+@pytest.mark.parametrize("tablefmt", tabulate_formats)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(colwidths=8),
+        dict(colwidths=[8, None], stralign=None),
+        dict(maxcolwidths=6, numalign=None),
+    ],
+)
+@pytest.mark.parametrize("text", ["fits", "is wrapped"])
+@pytest.mark.parametrize("sample", [4, 1000])
+def test_tabulate_iter_wraps_like_tabulate(tablefmt, kwargs, text, sample):
+    # a wrapped table is multiline only if rows follow the sample
+    if tablefmt == "asciidoc" and "stralign" in kwargs:
+        pytest.skip("asciidoc needs the alignment of every column")
+    rows = [["x", 1], ["", ""], SEPARATING_LINE, ["z", None], [text, 3]]
+    kwargs = dict(kwargs, headers=["h", "k"], tablefmt=tablefmt)
+    assert render(iter(rows), sample=sample, **kwargs) == tabulate(rows, **kwargs)
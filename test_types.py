@@ -0,0 +1,111 @@
+import pytest
+import tabulate as tabulate_module
+from tabulate import _afterpoint, _isint, _isnumber, _type, tabulate
+
+
+@pytest.mark.parametrize(
+    "string, valtype, afterpoint",
+    [
+        ("1", int, -1),
+        ("-1_000", int, -1),
+        (" 1.5e3 ", float, 4),
+        ("1.", float, 0),
+        (".5", float, 1),
+        ("1E-2", float, 2),
+        ("nan", float, -1),
+        ("-inf", float, -1),
+        ("Infinity", str, -1),
+        ("1e400", str, -1),  # too large for a float
+        ("1_", str, -1),
+        ("1__0", str, -1),
+        ("0x1a", str, -1),
+        ("12abc", str, -1),
+        ("", str, -1),
+        ("+", str, -1),
+        (".", str, -1),
+        ("1,000", str, -1),
+        ("1,000.5", str, 1),
+        ("1.5.2", str, -1),
+        ("+.5e-3", float, 4),
+        ("\t7\n", int, -1),
+        ("True", bool, -1),
+        ("١٢", int, -1),
+        ("١.٢", float, 1),
+        ("два", str, -1),
+    ],
+)
+def test_number_strings(string, valtype, afterpoint):
+    assert _type(string) is valtype
+    assert _isnumber(string) == (valtype in (int, float))
+    assert _isint(string) == (valtype is int)
+    assert _afterpoint(string) == afterpoint
+
+
+@pytest.mark.parametrize(
+    "string, valtype", [(b"12", int), (b"1.5", float), (b"spam", bytes)]
+)
+def test_number_bytes(string, valtype):
+    assert _type(string) is valtype
+    assert _isint(string) == (valtype is int)
+
+
+def test_ascii_strings_are_classified_without_conversions(monkeypatch):
+    def convert(conv, string):
+        raise AssertionError("%r was converted" % string)
+
+    monkeypatch.setattr(tabulate_module, "_isconvertible", convert)
+    rows = [["spam", "1", "2.5"], ["eggs", "-1_000", "nan"], ["", "0x1a", "1e400"]]
+    assert tabulate(rows) == "\n".join(
+        [
+            "----  ------  -----",
+            "spam  1       2.5",
+            "eggs  -1_000  nan",
+            "      0x1a    1e400",
+            "----  ------  -----",
+        ]
+    )
+
+
+def count_calls(monkeypatch, *names):
+    calls = dict.fromkeys(names, 0)
+    for name in names:
+        fn = getattr(tabulate_module, name)
+
+        def counting_fn(*args, _fn=fn, _name=name, **kwargs):
+            calls[_name] += 1
+            return _fn(*args, **kwargs)
+
+        monkeypatch.setattr(tabulate_module, name, counting_fn)
+    return calls
+
+
+def test_cells_are_classified_once(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "COLUMN_MEMO_SIZE", 0)
+    calls = count_calls(monkeypatch, "_type", "_afterpoint", "_strip_ansi")
+    rows = [[str(i), i + 0.5, None if i % 5 else "%d.25" % i] for i in range(50)]
+    table = tabulate(rows)
+    # an integer column has no digits after the point, the floats have them
+    # once each, and the missing values are parsed once for the column
+    assert calls == {"_type": 150, "_afterpoint": 61, "_strip_ansi": 0}
+    assert table.split("\n")[1:3] == [" 0   0.5   0.25", " 1   1.5"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, "2", None, True],
+        ["1.5", 2, "\x1b[31m3\x1b[0m", None],
+        ["1", None, "2,000", b"3"],
+        [True, False, None],
+        [],
+    ],
+)
+def test_column_analysis(values):
+    column = tabulate_module._ColumnAnalysis(values)
+    assert column.types == [_type(v) for v in values]
+    assert column.type is tabulate_module._column_type(values)
+    strings = [
+        tabulate_module._format(v, column.type, "g", "", "n/a") for v in values
+    ]
+    expected = [_afterpoint(tabulate_module._strip_ansi(s)) for s in strings]
+    assert column.afterpoints(strings, "", "n/a") == expected
@@ -0,0 +1,81 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+import tabulate as tabulate_module
+from tabulate import SEPARATING_LINE, TableLayout, tabulate
+
+
+FORMATS = ["simple", "grid", "pipe", "rst", "html", "latex"]
+
+
+def rows(n):
+    return [["row %d" % i, i * 1.5, "x" * (i % 7)] for i in range(n)]
+
+
+@pytest.mark.parametrize("tablefmt", FORMATS)
+def test_workers_executor(monkeypatch, tablefmt):
+    monkeypatch.setattr(tabulate_module, "ROW_BLOCK_SIZE", 7)
+    data = rows(30)
+    data[10:10] = [SEPARATING_LINE]
+    expected = tabulate(data, ["a", "b", "c"], tablefmt=tablefmt)
+    with ThreadPoolExecutor(2) as executor:
+        table = tabulate(data, ["a", "b", "c"], tablefmt=tablefmt, workers=executor)
+    assert table == expected
+
+
+def test_workers_processes():
+    data = rows(20050)
+    expected = tabulate(data, ["a", "b", "c"], tablefmt="grid")
+    assert tabulate(data, ["a", "b", "c"], tablefmt="grid", workers=2) == expected
+
+
+def test_workers_empty_blocks(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "ROW_BLOCK_SIZE", 2)
+    # multiline rows of empty cells have a blank line
+    data = [["a\nb", "x"]] + [["", ""]] * 4 + [["c", "d"]]
+    with ThreadPoolExecutor(2) as executor:
+        for tablefmt in ["simple", "plain"]:
+            table = tabulate(data, tablefmt=tablefmt, workers=executor)
+            assert table == tabulate(data, tablefmt=tablefmt)
+
+
+def test_workers_module_settings(monkeypatch):
+    monkeypatch.setattr(tabulate_module, "PRESERVE_WHITESPACE", True)
+    monkeypatch.setattr(tabulate_module, "WIDE_CHARS_MODE", False)
+    data = [[" spam ", "\x1b[31m日本\x1b[0m", 1.5], ["eggs", "ab", 22]]
+    expected = tabulate(data, ["a", "b", "c"])
+    # spawned workers import the module anew, with its default settings
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        assert tabulate(data, ["a", "b", "c"], workers=executor) == expected
+
+
+def test_colalign_none_is_not_padded():
+    rows = [["abc", 1], ["d", 22]]
+    expected = "---  --\nabc  1\nd  22\n---  --"
+    assert tabulate(rows, colalign=[None, "left"]) == expected
+    assert TableLayout(colalign=[None, "left"]).render(rows) == expected
+    latex = tabulate(rows, colalign=[None, "left"], tablefmt="latex")
+    assert latex.startswith("\\begin{tabular}{ll}")
+
+
+def test_rows_wider_than_headers():
+    rows = [["a", "b"], ["1", "2"], ["3", "4", "y"]]
+    expected = "\n".join(
+        [
+            "+-----+-----+",
+            "|   a |   b |",
+            "+=====+=====+",
+            "|   1 |   2 |",
+            "+-----+-----+",
+            "|   3 |   4 |",
+            "+-----+-----+",
+        ]
+    )
+    assert tabulate(rows, headers="firstrow", tablefmt="grid") == expected
+    layout = TableLayout(headers="firstrow", tablefmt="grid")
+    assert layout.render(rows) == expected
+    # the alignments of the dropped columns are still in the latex spec
+    latex = tabulate(rows[1:], ["a", "b"], tablefmt="latex")
+    assert latex.startswith("\\begin{tabular}{rrl}")
@@ -0,0 +1,130 @@
+import pytest
+from tabulate import (
+    _CustomTextWrap,
+    _strip_ansi,
+    _wrap_text_to_colwidths,
+    tabulate,
+    tabulate_iter,
+)
+
+wcwidth = pytest.importorskip("wcwidth")
+
+
+FAMILY = "\U0001F468\u200d\U0001F469\u200d\U0001F467"
+
+
+def visible_width(s):
+    return wcwidth.wcswidth(_strip_ansi(s))
+
+
+@pytest.mark.parametrize(
+    "text, width, lines",
+    [
+        ("abcdefghij klm", 4, ["abcd", "efgh", "ij", "klm"]),
+        ("x" * 10, 3, ["xxx", "xxx", "xxx", "x"]),
+        ("日本語のテキスト", 5, ["日本", "語の", "テキ", "スト"]),
+        ("ab日本語", 3, ["ab", "日", "本", "語"]),
+        ("spam 日本語のテキスト", 7, ["spam 日", "本語の", "テキス", "ト"]),
+        (
+            "\x1b[31mabcdefgh\x1b[0m ij",
+            3,
+            ["\x1b[31mabc\x1b[0m", "\x1b[31mdef\x1b[0m", "\x1b[31mgh\x1b[0m", "ij"],
+        ),
+        (
+            "a\x1b[1m\x1b[31mbc\x1b[0md",
+            2,
+            ["a\x1b[1m\x1b[31mb\x1b[0m", "\x1b[1m\x1b[31mc\x1b[0md"],
+        ),
+        (FAMILY + "ab", 3, [FAMILY + "a", "b"]),  # joined emoji stay together
+        ("e\u0301" * 4, 3, ["e\u0301" * 3, "e\u0301"]),  # combining accents
+        ("ab\u2764\ufe0fcd", 3, ["ab", "\u2764\ufe0fc", "d"]),  # emoji presentation
+        ("日本", 1, ["日", "本"]),  # too wide for any line
+    ],
+)
+def test_break_long_words(text, width, lines):
+    assert _CustomTextWrap(width=width).wrap(text) == lines
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Lovely spam, wonderful spam, " + "SpamSpamSpam" * 5,
+        "日本語" * 20 + " 日本",
+        "\x1b[32m" + "green and " * 5 + "\x1b[0m" + "x" * 30,
+        "café" * 20,
+    ],
+)
+@pytest.mark.parametrize("width", [1, 2, 5, 13])
+def test_wrapped_lines_fit(text, width):
+    lines = _CustomTextWrap(width=width).wrap(text)
+    # a wide character has a line of its own if it does not fit
+    widest = 2 if "日" in text else 1
+    assert all(visible_width(line) <= max(width, widest) for line in lines)
+    assert "".join(map(_strip_ansi, lines)).replace(" ", "") == _strip_ansi(
+        text
+    ).replace(" ", "")
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["日本" * 1000, "\x1b[31m" + "x" * 2000 + "\x1b[0m", "e\u0301" * 1000],
+    ids=["wide", "ansi", "combining"],
+)
+def test_long_words_are_measured_once(monkeypatch, text):
+    measured = []
+    for name in ["wcwidth", "wcswidth"]:
+        fn = getattr(wcwidth, name)
+        monkeypatch.setattr(
+            wcwidth, name, lambda s, *args, fn=fn: measured.append(len(s)) or fn(s)
+        )
+    lines = _CustomTextWrap(width=10).wrap(text)
+    assert "".join(map(_strip_ansi, lines)) == _strip_ansi(text)
+    # the text is measured a few times over, not once per line
+    assert sum(measured) < 10 * len(text)
+
+
+def test_maxcolwidths_long_word():
+    table = tabulate([["a", "x" * 12]], maxcolwidths=[None, 5], tablefmt="grid")
+    assert table.split("\n")[1:4] == ["| a | xxxxx |", "|   | xxxxx |", "|   | xx    |"]
+
+
+def count_wrappers(monkeypatch):
+    wrappers = []
+    init = _CustomTextWrap.__init__
+
+    def recording_init(self, *args, **kwargs):
+        wrappers.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(_CustomTextWrap, "__init__", recording_init)
+    return wrappers
+
+
+def test_one_wrapper_per_column(monkeypatch):
+    wrappers = count_wrappers(monkeypatch)
+    rows = [["a b c d e f", "x y z w", "spam"]] * 50
+    table = tabulate(rows, maxcolwidths=[3, 3, None])
+    assert len(wrappers) == 2
+    wrappers.clear()
+    lines = tabulate_iter(iter(rows), maxcolwidths=[3, 3, None], sample=2)
+    assert "\n".join(lines) == table
+    assert len(wrappers) == 2  # the streamed rows reuse them too
+
+
+def test_wrapper_colors_are_reset_for_every_cell():
+    rows = [["\x1b[31mred text that is long"], ["plain text long"]]
+    wrapped = _wrap_text_to_colwidths(rows, [6])
+    red = "\x1b[31m%s\x1b[0m"
+    assert wrapped == [
+        ["\n".join(red % word for word in ["red", "text", "that", "is", "long"])],
+        ["plain\ntext\nlong"],
+    ]
+
+
+def test_cells_which_fit_are_not_wrapped(monkeypatch):
+    def wrap(self, text):
+        raise AssertionError("%r was wrapped" % text)
+
+    monkeypatch.setattr(_CustomTextWrap, "wrap", wrap)
+    rows = [["spam", "a  b", 12345678, None, "anything goes here"]]
+    assert _wrap_text_to_colwidths(rows, [4, 4, 3, 3, None]) == rows